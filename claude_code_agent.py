@@ -42,7 +42,7 @@ from src.config import (
     apply_provider_config,
     load_project_config,
 )
-from src.security import SecurityValidator
+from src.security import SecurityValidator, configure_console_logging
 from src.session_manager import parse_build_plan_version
 from src.tracing import (
     get_tracing_manager,
@@ -2174,6 +2174,9 @@ async def main() -> None:
     # Parse arguments
     args = parse_arguments()
 
+    # Show the security hooks' allow/track messages alongside the prints
+    configure_console_logging()
+
     # Handle --version flag
     if args.version:
         show_version()
@@ -234,6 +234,14 @@ export class EcsClusterStack extends cdk.Stack {
       ],
     }));
 
+    // BatchGetSecretValue only supports '*'; each secret returned is still
+    // authorized against the GetSecretValue statement above
+    workerTaskRole.addToPolicy(new iam.PolicyStatement({
+      effect: iam.Effect.ALLOW,
+      actions: ['secretsmanager:BatchGetSecretValue'],
+      resources: ['*'],
+    }));
+
     workerTaskRole.addToPolicy(new iam.PolicyStatement({
       effect: iam.Effect.ALLOW,
       actions: [
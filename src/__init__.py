@@ -15,9 +15,11 @@ from .logging_utils import LoggingManager
 from .prompt_templates import PromptTemplater
 from .secrets import (
     cleanup_token_file,
+    clear_secret_cache,
     get_anthropic_api_key,
     get_github_token,
     get_secret,
+    prefetch_secrets,
     read_github_token_from_file,
     write_github_token_to_file,
 )
@@ -47,9 +49,11 @@ __all__ = [
     "release_issue_label",
     # Secrets helpers
     "cleanup_token_file",
+    "clear_secret_cache",
     "get_anthropic_api_key",
     "get_github_token",
     "get_secret",
+    "prefetch_secrets",
     "read_github_token_from_file",
     "write_github_token_to_file",
 ]
@@ -6,6 +6,8 @@ Uses JSON Lines format for easy parsing and rotation to manage disk space.
 Key features:
 - JSONL format (one JSON object per line) for easy parsing
 - Rotating file handler (10MB max, 5 backups = 50MB total)
+- Buffered writes: events are written in batches, at most a second late;
+  blocked actions and session end flush at once
 - Event types: bash_command, bash_blocked, file_read, file_write, file_blocked
 - Timestamps in ISO 8601 format
 - Structured data with tool name, input, outcome
@@ -14,9 +16,10 @@ Key features:
 import contextlib
 import json
 import logging
+import threading
 from datetime import UTC, datetime
 from enum import Enum
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
@@ -35,6 +38,55 @@ class AuditEventType(str, Enum):
     SESSION_END = "session_end"
 
 
+class _BatchingHandler(MemoryHandler):
+    """MemoryHandler that passes its buffered records to the target as one write.
+
+    The stock MemoryHandler replays records one at a time, so the target still
+    does a rollover check, write and flush per event. Audit records are
+    pre-formatted JSON lines, so they can be joined into a single record.
+
+    Records never wait in the buffer longer than ``flush_interval`` seconds:
+    the first record into an empty buffer arms a timer that flushes it.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        flush_interval: float,
+        flushLevel: int = logging.ERROR,  # MemoryHandler keyword name
+        target: logging.Handler | None = None,
+    ) -> None:
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval
+        self._timer: threading.Timer | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a record, arming the idle flush timer if needed."""
+        super().emit(record)
+        with self.lock:
+            if self.buffer and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write all buffered records to the target in one batch."""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self.buffer or self.target is None:
+                return
+            batch = logging.makeLogRecord(
+                {
+                    "msg": "\n".join(record.getMessage() for record in self.buffer),
+                    "levelno": max(record.levelno for record in self.buffer),
+                }
+            )
+            self.buffer.clear()
+            self.target.handle(batch)
+
+
 class AuditLogger:
     """Audit logger for agent actions.
 
@@ -45,6 +97,8 @@ class AuditLogger:
     # Configuration
     MAX_BYTES = 10 * 1024 * 1024  # 10 MB per file
     BACKUP_COUNT = 5  # 5 backup files = 50 MB total
+    BUFFER_CAPACITY = 100  # events held in memory before a batched write
+    FLUSH_INTERVAL_SECONDS = 1.0  # longest an event waits in the buffer
 
     def __init__(
         self,
@@ -61,6 +115,7 @@ class AuditLogger:
         """
         self.enabled = enabled
         self._logger: logging.Logger | None = None
+        self._file_handler: logging.Handler | None = None
 
         if not enabled:
             return
@@ -79,19 +134,34 @@ class AuditLogger:
         self._logger.setLevel(logging.INFO)
         self._logger.propagate = False  # Don't send to root logger
 
-        # Remove existing handlers
+        # Remove existing handlers (closing flushes anything they buffered).
+        # MemoryHandler.close() drops its target, so grab the file handler first.
         for handler in self._logger.handlers[:]:
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
             self._logger.removeHandler(handler)
 
-        # Add rotating file handler
-        handler = RotatingFileHandler(
+        # Rotating file handler, fed in batches through an in-memory buffer.
+        # Blocked actions are logged at WARNING, which flushes the buffer
+        # immediately; other events are written within FLUSH_INTERVAL_SECONDS
+        # and logging's exit hook flushes whatever is left.
+        self._file_handler = RotatingFileHandler(
             log_path,
             maxBytes=self.MAX_BYTES,
             backupCount=self.BACKUP_COUNT,
             encoding="utf-8",
         )
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        self._logger.addHandler(handler)
+        self._file_handler.setFormatter(logging.Formatter("%(message)s"))
+        self._logger.addHandler(
+            _BatchingHandler(
+                self.BUFFER_CAPACITY,
+                self.FLUSH_INTERVAL_SECONDS,
+                flushLevel=logging.WARNING,
+                target=self._file_handler,
+            )
+        )
 
         self.log_path = log_path
 
@@ -127,8 +197,9 @@ class AuditLogger:
             event["details"] = details
 
         # Don't let audit logging failures break the agent
+        level = logging.WARNING if outcome == "blocked" else logging.INFO
         with contextlib.suppress(Exception):
-            self._logger.info(json.dumps(event, default=str))
+            self._logger.log(level, json.dumps(event, default=str))
 
     def _sanitize_input(self, input_data: dict[str, Any]) -> dict[str, Any]:
         """Sanitize input data to avoid logging sensitive information.
@@ -280,6 +351,13 @@ class AuditLogger:
             outcome=reason,
             details=details if details else None,
         )
+        self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered audit events to the log file."""
+        if self._logger:
+            for handler in self._logger.handlers:
+                handler.flush()
 
     def close(self) -> None:
         """Close the audit logger and flush handlers."""
@@ -287,6 +365,9 @@ class AuditLogger:
             for handler in self._logger.handlers[:]:
                 handler.close()
                 self._logger.removeHandler(handler)
+        if self._file_handler:
+            self._file_handler.close()
+            self._file_handler = None
 
 
 # Global audit logger instance
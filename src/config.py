@@ -400,69 +400,72 @@ WARNING_THRESHOLD_HIGH = 90  # Red warning
 WARNING_THRESHOLD_MEDIUM = 75  # Yellow notice
 
 # File patterns for templating
-TEMPLATE_FILE_EXTENSIONS = {".txt", ".md"}
+TEMPLATE_FILE_EXTENSIONS: frozenset[str] = frozenset({".txt", ".md"})
 
 # Required project files (system_prompt.txt now comes from top-level prompts directory)
 REQUIRED_PROJECT_FILES = ["BUILD_PLAN.md"]
 OPTIONAL_PROJECT_FILES = ["DEBUGGING_GUIDE.md", "system_prompt.txt"]
 
 # Log file settings
-LOG_FILE_PATTERN = "*.json"
 LOGS_DIR_NAME = "logs"
+EVENTS_LOG_FILE_NAME = "events.jsonl"
 
 # Security: Allowed bash commands
-ALLOWED_BASH_COMMANDS = [
-    "npm",
-    "npx",
-    "pnpm",
-    "node",
-    "curl",
-    "mkdir",
-    "echo",
-    "ls",
-    "cat",
-    "cd",
-    "pwd",
-    "touch",
-    "lsof",
-    "ps",
-    "jq",
-    "sed",
-    "awk",
-    "find",
-    "git",
-    "cp",
-    "wc",
-    "grep",
-    "sleep",
-    "kill",
-    "tail",
-    "sqlite3",
-    "netstat",
-    "rg",
-    "chmod",
-    "./init.sh",
-    "test",
-    "node",
-    "which",
-    "time",
-    "head",
-    "pip",
-    "pip3",
-    "playwright",
-    "python3",
-    "google-chrome",
-]
+ALLOWED_BASH_COMMANDS = frozenset(
+    {
+        "npm",
+        "npx",
+        "pnpm",
+        "node",
+        "curl",
+        "mkdir",
+        "echo",
+        "ls",
+        "cat",
+        "cd",
+        "pwd",
+        "touch",
+        "lsof",
+        "ps",
+        "jq",
+        "sed",
+        "awk",
+        "find",
+        "git",
+        "cp",
+        "wc",
+        "grep",
+        "sleep",
+        "kill",
+        "tail",
+        "sqlite3",
+        "netstat",
+        "rg",
+        "chmod",
+        "./init.sh",
+        "test",
+        "which",
+        "time",
+        "head",
+        "pip",
+        "pip3",
+        "playwright",
+        "python3",
+        "google-chrome",
+    }
+)
 
 # Special command patterns
-ALLOWED_RM_COMMANDS = ["rm -rf node_modules"]
+ALLOWED_RM_COMMANDS = frozenset({"rm -rf node_modules"})
 ALLOWED_NODE_PATTERNS = ["server.js", "server/index.js", "playwright-test.cjs"]
-ALLOWED_PKILL_PATTERNS = [
-    'pkill -f "node server/index.js"',
-    'pkill -f "node server.js"',
-    'pkill -f "vite"',
-    'pkill -f "chrome"',
-]
+ALLOWED_PKILL_PATTERNS = frozenset(
+    {
+        'pkill -f "node server/index.js"',
+        'pkill -f "node server.js"',
+        'pkill -f "vite"',
+        'pkill -f "chrome"',
+    }
+)
 
 # Blocked sed patterns - prevent bulk modification of test results
 # These regex patterns match sed commands that should be blocked
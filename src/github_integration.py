@@ -9,13 +9,17 @@ Handles:
 """
 
 import os
-from dataclasses import dataclass
-from datetime import datetime
+import string
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Any
 
 from github import Github, GithubException
 from github.Issue import Issue
 
+from .retry import pooled_session
+
 
 # Staff who can approve builds with 🚀 reaction
 # Configure via AUTHORIZED_APPROVERS env var (comma-separated GitHub usernames)
@@ -29,8 +33,98 @@ LABEL_DEPLOYED = "deployed"
 LABEL_FAILED = "tests-failed"
 LABEL_REBUILDING = "rebuilding"
 
+# FEATURE_REQUEST.md body, parsed once at import by string.Template
+_FEATURE_PROMPT_TEMPLATE = string.Template(
+    """# Feature Enhancement Request
+
+## From GitHub Issue #$number
+
+**Title:** $title
+**Votes:** $votes 👍
+**Approved by:** $approved_by
+**Requested:** $requested
+
+---
+
+## Feature Specification
+
+$body
+
+---
+
+## Implementation Instructions
+
+You are enhancing an **existing application** (antodo task manager).
+
+### Existing Codebase
+
+The application already has a working codebase at: `$base_code_dir`
+
+**CRITICAL:** Review the existing code structure before making changes!
+
+### Your Task
+
+1. **Review existing code** to understand:
+   - Current architecture and patterns
+   - Existing components and utilities
+   - Code style and conventions
+   - Testing patterns
+
+2. **Add the requested feature** by:
+   - Following existing patterns
+   - Integrating with current components
+   - Updating only necessary files
+   - Maintaining code quality
+
+3. **Write tests** for the new feature:
+   - E2E test using Playwright
+   - Validate feature works correctly
+   - Ensure no regressions to existing features
+
+4. **Verify quality**:
+   - All new tests pass
+   - All existing tests still pass
+   - No console errors
+   - Code committed with clear messages
+
+### Constraints
+
+⚠️ **DO NOT:**
+- Rewrite existing working code unnecessarily
+- Break existing functionality
+- Change architectural patterns
+- Remove features
+
+✅ **DO:**
+- Preserve all existing features
+- Follow current code style
+- Add comprehensive tests
+- Make surgical, focused changes
+
+### Success Criteria
+
+Feature is complete when:
+- [ ] Feature works as specified
+- [ ] E2E test passes reliably
+- [ ] No regressions (existing tests pass)
+- [ ] No console errors
+- [ ] Code committed to `issue-$number` branch
+- [ ] Agent signals: "🎉 IMPLEMENTATION COMPLETE"
 
-@dataclass
+### Testing
+
+Validate the feature by testing that:
+$test_criteria
+"""
+)
+
+
+def _utc_iso() -> str:
+    """Current UTC time for issue comments, e.g. 2025-01-01T12:00:00Z."""
+    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+@dataclass(slots=True, frozen=True)
 class BuildableIssue:
     """Represents an issue approved for building"""
 
@@ -42,6 +136,11 @@ class BuildableIssue:
     has_staff_approval: bool
     approved_by: list[str]
     created_at: datetime
+    created_iso: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Format once; to_dict() may be called many times for display/sorting
+        object.__setattr__(self, "created_iso", self.created_at.isoformat())
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -52,7 +151,7 @@ class BuildableIssue:
             "votes": self.thumbs_up_count,
             "approved": self.has_staff_approval,
             "approved_by": self.approved_by,
-            "created": self.created_at.isoformat(),
+            "created": self.created_iso,
         }
 
 
@@ -137,8 +236,10 @@ class GitHubIssueManager:
                 )
             )
 
-        # Sort by votes (high to low), then by age (old to new)
-        buildable.sort(key=lambda i: (-i.thumbs_up_count, i.created_at))
+        # Sort by votes (high to low), then by age (old to new). Two stable
+        # sorts with C-level attrgetter keys avoid a per-item key tuple
+        buildable.sort(key=attrgetter("created_at"))
+        buildable.sort(key=attrgetter("thumbs_up_count"), reverse=True)
 
         return buildable
 
@@ -194,7 +295,7 @@ class GitHubIssueManager:
         issue.add_to_labels(LABEL_BUILDING)
 
         # Add comment with session info
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = _utc_iso()
         rebase_note = (
             "\n*Rebuilding on latest main after merge conflict.*" if is_rebase else ""
         )
@@ -235,7 +336,7 @@ Commits will be pushed to branch `issue-{issue_number}`.
             issue.add_to_labels(LABEL_DEPLOYED)
 
         # Add completion comment
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = _utc_iso()
         prod_line = f"\n- 🌐 Production: {production_url}" if production_url else ""
 
         comment = f"""✅ **Build Complete!**
@@ -276,7 +377,7 @@ All E2E tests passed. Closing this issue.
         issue.add_to_labels(LABEL_FAILED)
 
         # Add failure comment
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = _utc_iso()
         workflow_link = (
             f"\n\nCheck [workflow run]({workflow_url}) for details."
             if workflow_url
@@ -297,7 +398,9 @@ The issue remains open for retry. Staff can remove the `{LABEL_FAILED}` label an
 """
         issue.create_comment(comment)
 
-    def generate_feature_prompt(self, issue: Issue, base_code_dir: str) -> str:
+    def generate_feature_prompt(
+        self, issue: BuildableIssue | Issue, base_code_dir: str
+    ) -> str:
         """
         Generate FEATURE_REQUEST.md prompt for incremental feature.
 
@@ -305,98 +408,30 @@ The issue remains open for retry. Staff can remove the `{LABEL_FAILED}` label an
         This tells the agent to enhance existing code.
 
         Args:
-            issue: GitHub Issue object
+            issue: BuildableIssue (reuses its votes/approvers) or GitHub Issue
             base_code_dir: Path to existing codebase
 
         Returns:
             Feature request prompt text
         """
-        # Count votes
-        votes = self._count_thumbs_up(issue)
-        approvers = self._get_staff_approvers(issue)
-
-        template = f"""# Feature Enhancement Request
-
-## From GitHub Issue #{issue.number}
-
-**Title:** {issue.title}
-**Votes:** {votes} 👍
-**Approved by:** {', '.join(approvers)}
-**Requested:** {issue.created_at.isoformat()}
-
----
-
-## Feature Specification
-
-{issue.body}
-
----
-
-## Implementation Instructions
-
-You are enhancing an **existing application** (antodo task manager).
-
-### Existing Codebase
-
-The application already has a working codebase at: `{base_code_dir}`
-
-**CRITICAL:** Review the existing code structure before making changes!
-
-### Your Task
-
-1. **Review existing code** to understand:
-   - Current architecture and patterns
-   - Existing components and utilities
-   - Code style and conventions
-   - Testing patterns
-
-2. **Add the requested feature** by:
-   - Following existing patterns
-   - Integrating with current components
-   - Updating only necessary files
-   - Maintaining code quality
-
-3. **Write tests** for the new feature:
-   - E2E test using Playwright
-   - Validate feature works correctly
-   - Ensure no regressions to existing features
-
-4. **Verify quality**:
-   - All new tests pass
-   - All existing tests still pass
-   - No console errors
-   - Code committed with clear messages
-
-### Constraints
-
-⚠️ **DO NOT:**
-- Rewrite existing working code unnecessarily
-- Break existing functionality
-- Change architectural patterns
-- Remove features
-
-✅ **DO:**
-- Preserve all existing features
-- Follow current code style
-- Add comprehensive tests
-- Make surgical, focused changes
-
-### Success Criteria
-
-Feature is complete when:
-- [ ] Feature works as specified
-- [ ] E2E test passes reliably
-- [ ] No regressions (existing tests pass)
-- [ ] No console errors
-- [ ] Code committed to `issue-{issue.number}` branch
-- [ ] Agent signals: "🎉 IMPLEMENTATION COMPLETE"
-
-### Testing
+        if isinstance(issue, BuildableIssue):
+            # Already populated by get_buildable_issues(); no API calls needed
+            votes = issue.thumbs_up_count
+            approvers = issue.approved_by
+        else:
+            votes = self._count_thumbs_up(issue)
+            approvers = self._get_staff_approvers(issue)
 
-Validate the feature by testing that:
-{self._generate_test_criteria(issue.body)}
-"""
-        return template
+        return _FEATURE_PROMPT_TEMPLATE.substitute(
+            number=issue.number,
+            title=issue.title,
+            votes=votes,
+            approved_by=", ".join(approvers),
+            requested=issue.created_at.isoformat(),
+            body=issue.body,
+            base_code_dir=base_code_dir,
+            test_criteria=self._generate_test_criteria(issue.body),
+        )
 
     def _generate_test_criteria(self, issue_body: str) -> str:
         """Generate test criteria from issue specification"""
@@ -417,18 +452,19 @@ Validate the feature by testing that:
         Returns:
             List of approver usernames
         """
-        approvers = []
+        approvers: set[str] = set()
         try:
-            reactions = issue.get_reactions()
-            for reaction in reactions:
-                if (
-                    reaction.content in ["rocket", "hooray"]
-                    and reaction.user.login in AUTHORIZED_APPROVERS
-                ):
-                    approvers.append(reaction.user.login)
+            # Read the raw payload rather than going through the NamedUser
+            # wrapper for every reaction
+            for reaction in issue.get_reactions():
+                data = reaction.raw_data
+                if data.get("content") in ("rocket", "hooray"):
+                    login = (data.get("user") or {}).get("login")
+                    if login in AUTHORIZED_APPROVERS:
+                        approvers.add(login)
         except GithubException:
             pass
-        return list(set(approvers))  # Deduplicate
+        return list(approvers)
 
     def _count_thumbs_up(self, issue: Issue) -> int:
         """
@@ -442,7 +478,7 @@ Validate the feature by testing that:
         """
         try:
             reactions = issue.get_reactions()
-            return sum(1 for r in reactions if r.content == "+1")
+            return sum(1 for r in reactions if r.raw_data.get("content") == "+1")
         except GithubException:
             return 0
 
@@ -463,7 +499,8 @@ Validate the feature by testing that:
 # =============================================================================
 # Simple REST API helpers for Orchestrator
 # =============================================================================
-# These functions use requests directly for lightweight orchestrator operations.
+# These functions use requests directly for lightweight orchestrator operations,
+# sharing one keep-alive session (retry.pooled_session) across calls.
 # Use GitHubIssueManager for more complex operations with PyGithub.
 
 
@@ -486,7 +523,7 @@ def claim_issue_label(
     Returns:
         True if successful
     """
-    import requests
+    session = pooled_session()
 
     try:
         headers = {
@@ -494,7 +531,7 @@ def claim_issue_label(
             "Accept": "application/vnd.github.v3+json",
         }
         url = f"https://api.github.com/repos/{github_repo}/issues/{issue_number}/labels"
-        response = requests.post(
+        response = session.post(
             url, headers=headers, json={"labels": [label]}, timeout=30
         )
         response.raise_for_status()
@@ -526,7 +563,7 @@ def release_issue_label(
     Returns:
         True if successful
     """
-    import requests
+    session = pooled_session()
 
     try:
         headers = {
@@ -536,7 +573,7 @@ def release_issue_label(
 
         # Remove the label
         url = f"https://api.github.com/repos/{github_repo}/issues/{issue_number}/labels/{label}"
-        response = requests.delete(url, headers=headers, timeout=30)
+        response = session.delete(url, headers=headers, timeout=30)
         if response.status_code not in [200, 204, 404]:  # 404 = already removed
             response.raise_for_status()
         print(f"✅ Removed '{label}' label from issue #{issue_number}")
@@ -544,7 +581,7 @@ def release_issue_label(
         # Optionally add complete label
         if add_complete_label:
             add_url = f"https://api.github.com/repos/{github_repo}/issues/{issue_number}/labels"
-            requests.post(
+            session.post(
                 add_url,
                 headers=headers,
                 json={"labels": [LABEL_COMPLETE]},
@@ -575,7 +612,7 @@ def post_comment(
     Returns:
         True if successful
     """
-    import requests
+    session = pooled_session()
 
     try:
         headers = {
@@ -583,7 +620,7 @@ def post_comment(
             "Accept": "application/vnd.github.v3+json",
         }
         url = f"https://api.github.com/repos/{github_repo}/issues/{issue_number}/comments"
-        response = requests.post(url, headers=headers, json={"body": body}, timeout=30)
+        response = session.post(url, headers=headers, json={"body": body}, timeout=30)
         response.raise_for_status()
         return True
     except Exception as e:
@@ -610,7 +647,7 @@ def get_approved_issues_simple(
     Returns:
         List of approved issues sorted by votes
     """
-    import requests
+    session = pooled_session()
 
     try:
         headers = {
@@ -621,7 +658,7 @@ def get_approved_issues_simple(
         # Get open issues
         url = f"https://api.github.com/repos/{github_repo}/issues"
         params = {"state": "open", "per_page": 100}
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = session.get(url, headers=headers, params=params, timeout=30)
         response.raise_for_status()
         issues = response.json()
 
@@ -647,7 +684,7 @@ def get_approved_issues_simple(
             if not reactions_url:
                 continue
 
-            reactions_response = requests.get(
+            reactions_response = session.get(
                 reactions_url, headers=headers, timeout=30
             )
             if reactions_response.status_code != 200:
@@ -2,12 +2,60 @@
 
 import builtins
 import json
-from dataclasses import asdict
+import os
+import queue
+import threading
+import time
+from dataclasses import fields, is_dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, BinaryIO, TextIO
 
-from .config import LOGS_DIR_NAME
+from .config import EVENTS_LOG_FILE_NAME, LOGS_DIR_NAME
+
+
+# orjson is an optional speedup for the JSON log hot path
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_line(data: Any) -> bytes:
+    """Serialize ``data`` as one UTF-8 JSON Lines record."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; let stdlib json handle it
+    return (json.dumps(data, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _dataclass_to_dict(obj: Any) -> dict[str, Any]:
+    """Shallow alternative to dataclasses.asdict() for SDK messages.
+
+    Nested dataclasses (directly or inside lists, e.g. content blocks) are
+    converted; every other value, including dicts, is kept by reference
+    instead of deep-copied, since json.dumps walks it later anyway.
+    """
+    return {field.name: _to_jsonable(getattr(obj, field.name)) for field in fields(obj)}
+
+
+def _to_jsonable(value: Any) -> Any:
+    """Convert dataclasses in ``value`` to dicts, leaving anything else as-is."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return _dataclass_to_dict(value)
+    if isinstance(value, list) and any(
+        is_dataclass(item) and not isinstance(item, type) for item in value
+    ):
+        return [_to_jsonable(item) for item in value]
+    return value
 
 
 class LoggingManager:
@@ -16,52 +64,143 @@ class LoggingManager:
     def __init__(self, log_file: TextIO | None = None):
         self.log_file = log_file
         self.session_id: str | None = None
+        # Measuring a message means serializing it an extra time, so only do
+        # it when explicitly requested
+        self.debug_sizes = os.environ.get("CLAUDE_DEBUG_SIZE", "").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+        # JSON log lines are appended by a background writer thread
+        self._log_queue: queue.SimpleQueue[tuple[Path, bytes] | None] = (
+            queue.SimpleQueue()
+        )
+        self._log_writer: threading.Thread | None = None
+        # Prints held back by the flush throttle are flushed by one long-lived
+        # thread; the lock guards the log file between it and print()
+        self._log_file_lock = threading.Lock()
+        self._last_log_flush = 0.0
+        self._log_flush_requested = threading.Event()
+        self._log_flusher_stop = threading.Event()
+        self._log_flusher: threading.Thread | None = None
 
     def setup_timestamped_print(self, log_file_path: Path) -> None:
         """Set up timestamped printing to both console and log file."""
         self.log_file = open(log_file_path, "a", encoding="utf-8")
         original_print = builtins.print
 
+        # Bursts of prints share a second, so only format the timestamp when
+        # the second changes, and flush the file at most every 100ms. Lines
+        # printed inside that window are flushed by the flusher thread once it
+        # closes, so the end of a burst never stays buffered.
+        last_second = -1
+        last_prefix = ""
+
         def timestamped_print(*args: Any, **kwargs: Any) -> None:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            timestamped_args = (f"[{timestamp}]", *args)
+            nonlocal last_second, last_prefix
+            now = time.time()
+            second = int(now)
+            if second != last_second:
+                timestamp = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+                last_second, last_prefix = second, f"[{timestamp}]"
+            timestamped_args = (last_prefix, *args)
             original_print(*timestamped_args, **kwargs)  # Print to terminal
-            if self.log_file:
+            with self._log_file_lock:
+                if not self.log_file:
+                    return
                 original_print(
                     *timestamped_args, **kwargs, file=self.log_file
                 )  # Print to file
-                self.log_file.flush()  # Ensure it's written immediately
+                if now - self._last_log_flush >= 0.1:
+                    self.log_file.flush()
+                    self._last_log_flush = now
+                elif not self._log_flush_requested.is_set():
+                    self._log_flush_requested.set()
 
+        if self._log_flusher is None:
+            self._log_flusher_stop.clear()
+            self._log_flusher = threading.Thread(
+                target=self._flush_log_file, name="log-file-flusher", daemon=True
+            )
+            self._log_flusher.start()
         builtins.print = timestamped_print
 
+    def _flush_log_file(self) -> None:
+        """Flush prints held back by the throttle until close() stops it."""
+        while True:
+            self._log_flush_requested.wait()
+            # Let the rest of the burst arrive, then flush it in one go
+            stopping = self._log_flusher_stop.wait(0.1)
+            with self._log_file_lock:
+                self._log_flush_requested.clear()
+                if self.log_file:
+                    self.log_file.flush()
+                    self._last_log_flush = time.time()
+            if stopping:
+                return
+
     def close(self) -> None:
-        """Close the log file."""
-        if self.log_file:
-            self.log_file.close()
-            self.log_file = None
+        """Flush pending JSON logs and close the log file."""
+        if self._log_writer:
+            self._log_queue.put(None)
+            self._log_writer.join()
+            self._log_writer = None
+        if self._log_flusher:
+            self._log_flusher_stop.set()
+            self._log_flush_requested.set()
+            self._log_flusher.join()
+            self._log_flusher = None
+        with self._log_file_lock:
+            if self.log_file:
+                self.log_file.close()
+                self.log_file = None
 
     def save_json_log(self, run_dir: Path, data: dict[str, Any]) -> None:
-        """Save a JSON log entry with timestamp.
+        """Append a JSON log entry to the run's events.jsonl.
+
+        The entry is serialized immediately (so later mutation of ``data``
+        does not affect it) and written by a background thread.
 
         Args:
             run_dir: Directory to save logs in
             data: Data to save as JSON
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[
-            :-3
-        ]  # Include milliseconds
-
-        # Create logs subdirectory
-        logs_dir = run_dir / LOGS_DIR_NAME
-        logs_dir.mkdir(exist_ok=True)
-
-        log_file = logs_dir / f"{timestamp}.json"
-
         try:
-            with open(log_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            line = _json_line(data)
         except Exception as e:
             print(f"⚠️ Failed to save JSON log: {e}")
+            return
+
+        if self._log_writer is None:
+            self._log_writer = threading.Thread(
+                target=self._drain_log_queue, name="json-log-writer", daemon=True
+            )
+            self._log_writer.start()
+        self._log_queue.put((run_dir / LOGS_DIR_NAME, line))
+
+    def _drain_log_queue(self) -> None:
+        """Write queued JSON log lines until close() sends the stop marker."""
+        handles: dict[Path, BinaryIO] = {}
+        try:
+            while (item := self._log_queue.get()) is not None:
+                logs_dir, line = item
+                try:
+                    handle = handles.get(logs_dir)
+                    if handle is None:
+                        logs_dir.mkdir(exist_ok=True)
+                        handle = open(logs_dir / EVENTS_LOG_FILE_NAME, "ab")
+                        handles[logs_dir] = handle
+                    handle.write(line)
+
+                    # Flush once the burst is drained so the file stays current
+                    if self._log_queue.empty():
+                        for open_handle in handles.values():
+                            open_handle.flush()
+                except Exception as e:
+                    print(f"⚠️ Failed to save JSON log: {e}")
+        finally:
+            for handle in handles.values():
+                handle.close()
 
     def log_user_query(self, run_dir: Path, query: str, context: str = "") -> None:
         """Log a user query/request to JSON.
@@ -107,8 +246,8 @@ class LoggingManager:
         if isinstance(
             message, (AssistantMessage, ResultMessage, SystemMessage, UserMessage)
         ):
-            # Use dataclass asdict for structured objects
-            data = asdict(message)
+            # Shallow conversion for structured objects
+            data = _dataclass_to_dict(message)
             data["message_type"] = type(message).__name__
 
             # Add size estimation for debugging
@@ -119,7 +258,7 @@ class LoggingManager:
             message, (TextBlock, ToolUseBlock, ToolResultBlock, ThinkingBlock)
         ):
             # Content blocks
-            data = asdict(message)
+            data = _dataclass_to_dict(message)
             data["block_type"] = type(message).__name__
 
             # Add size estimation for debugging
@@ -154,8 +293,11 @@ class LoggingManager:
             type_name: Type name for logging
             size_threshold: Threshold above which to log size warnings
         """
+        if not self.debug_sizes:
+            return
+
         try:
-            data_size = len(json.dumps(data, default=str))
+            data_size = len(_json_line(data)) - 1  # minus the newline
             data["_debug_size_bytes"] = data_size
             if data_size > size_threshold:
                 print(f"⚠️ Large message detected: {type_name} ({data_size:,} bytes)")
@@ -1,12 +1,41 @@
 """Prompt templating utilities for Claude Code."""
 
+import functools
+import os
+import re
 import shutil
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from .config import TEMPLATE_FILE_EXTENSIONS
 
 
+@functools.lru_cache(maxsize=32)
+def _placeholder_pattern(keys: frozenset[str]) -> re.Pattern[str]:
+    """Compile a single alternation matching every ``{key}`` placeholder."""
+    return re.compile("|".join(re.escape("{" + key + "}") for key in keys))
+
+
+def _make_substitutor(template_vars: dict[str, Any]) -> Callable[[str], str]:
+    """Build a reusable function that applies ``template_vars`` to a string."""
+    if not template_vars:
+        return str
+
+    # Stringify each value once, then substitute every placeholder in a
+    # single pass instead of one full-string replace() per variable
+    values = {"{" + key + "}": str(value) for key, value in template_vars.items()}
+    pattern = _placeholder_pattern(frozenset(template_vars))
+
+    def substitute(content: str) -> str:
+        # Most lines and small files contain no placeholder at all
+        if "{" not in content:
+            return content
+        return pattern.sub(lambda match: values[match.group(0)], content)
+
+    return substitute
+
+
 class PromptTemplater:
     """Handles template variable substitution in prompt files."""
 
@@ -21,10 +50,7 @@ class PromptTemplater:
         Returns:
             Content with template variables replaced
         """
-        for key, value in template_vars.items():
-            placeholder = "{" + key + "}"
-            content = content.replace(placeholder, str(value))
-        return content
+        return _make_substitutor(template_vars)(content)
 
     @staticmethod
     def copy_with_templating(
@@ -37,21 +63,24 @@ class PromptTemplater:
             dest_dir: Destination directory path
             template_vars: Dictionary of variables to substitute
         """
-        # Create destination directory
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy all files, applying templating to text files
-        for item in src_dir.iterdir():
-            src_path = item
-            dest_path = dest_dir / item.name
-
-            if item.is_file():
-                PromptTemplater._copy_file_with_templating(
-                    src_path, dest_path, template_vars
-                )
-            elif item.is_dir():
-                # Recursively copy subdirectories with templating
-                PromptTemplater.copy_with_templating(src_path, dest_path, template_vars)
+        # Walk iteratively; scandir() entries carry their file type from the
+        # directory read, so is_file()/is_dir() don't need an extra stat()
+        pending = [(src_dir, dest_dir)]
+        while pending:
+            current_src, current_dest = pending.pop()
+            current_dest.mkdir(parents=True, exist_ok=True)
+
+            # Copy all files, applying templating to text files
+            with os.scandir(current_src) as entries:
+                for entry in entries:
+                    dest_path = current_dest / entry.name
+
+                    if entry.is_file():
+                        PromptTemplater._copy_file_with_templating(
+                            Path(entry.path), dest_path, template_vars
+                        )
+                    elif entry.is_dir():
+                        pending.append((Path(entry.path), dest_path))
 
     @staticmethod
     def _copy_file_with_templating(
@@ -67,16 +96,14 @@ class PromptTemplater:
         # Apply templating to text files
         if src_path.suffix in TEMPLATE_FILE_EXTENSIONS:
             try:
-                with open(src_path, encoding="utf-8") as f:
-                    content = f.read()
-
-                # Apply template substitution
-                templated_content = PromptTemplater.apply_template(
-                    content, template_vars
-                )
-
-                with open(dest_path, "w", encoding="utf-8") as f:
-                    f.write(templated_content)
+                # Stream line by line so the whole file is never held in
+                # memory; placeholders never span a line break
+                substitute = _make_substitutor(template_vars)
+                with (
+                    open(src_path, encoding="utf-8") as src,
+                    open(dest_path, "w", encoding="utf-8") as dest,
+                ):
+                    dest.writelines(map(substitute, src))
             except Exception as e:
                 # Fallback to regular copy if templating fails
                 print(
@@ -84,7 +111,7 @@ class PromptTemplater:
                 )
                 shutil.copy2(src_path, dest_path)
         else:
-            # Copy non-text files as-is
+            # Copy non-text files as-is (copy2 uses sendfile() on Linux)
             shutil.copy2(src_path, dest_path)
 
     @staticmethod
@@ -10,16 +10,27 @@ Key features:
 - HTTP status code classification (transient vs permanent)
 - Async support for async functions
 - Logging of retry attempts
+- Optional circuit breaker to fail fast against persistently failing targets
+- Shared keep-alive HTTP session so retried calls reuse connections
 """
 
 import asyncio
 import functools
 import logging
+import math
 import random
+import re
+import threading
 import time
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any, ParamSpec, TypeVar
+from collections.abc import Callable, Hashable, Iterator
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+
+if TYPE_CHECKING:
+    import requests
 
 
 logger = logging.getLogger(__name__)
@@ -29,16 +40,21 @@ T = TypeVar("T")
 P = ParamSpec("P")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     """Configuration for retry behavior.
 
+    Immutable; use dataclasses.replace() to derive a modified copy.
+
     Attributes:
         max_retries: Maximum number of retry attempts (default: 3)
         base_delay: Initial delay in seconds (default: 1.0)
         max_delay: Maximum delay in seconds (default: 60.0)
         exponential_base: Base for exponential backoff (default: 2.0)
         jitter: Whether to add random jitter to delays (default: True)
+        total_deadline: Overall time budget in seconds across all attempts
+            and sleeps; when the next backoff would reach it, the error is
+            raised at once instead of sleeping (default: None, unbounded)
     """
 
     max_retries: int = 3
@@ -46,6 +62,7 @@ class RetryConfig:
     max_delay: float = 60.0
     exponential_base: float = 2.0
     jitter: bool = True
+    total_deadline: float | None = None
 
 
 # HTTP status codes that indicate transient errors (should retry)
@@ -72,20 +89,47 @@ PERMANENT_STATUS_CODES: frozenset[int] = frozenset(
     }
 )
 
+# Exception types that indicate transient network errors
+TRANSIENT_ERROR_TYPES: tuple[type[Exception], ...] = (
+    ConnectionError,
+    TimeoutError,
+    OSError,
+)
 
-class RetryableError(Exception):
-    """Exception that indicates a retryable error.
+# Error message fragments that indicate transient errors (case-insensitive)
+TRANSIENT_ERROR_PATTERNS: tuple[str, ...] = (
+    "timeout",
+    "connection refused",
+    "connection reset",
+    "temporarily unavailable",
+    "rate limit",
+    "throttl",
+    "overloaded",
+    "too many requests",
+)
 
-    Use this to wrap errors that should trigger retry logic.
+# Single alternation so classification is one regex search per error
+_TRANSIENT_MESSAGE_RE = re.compile(
+    "|".join(map(re.escape, TRANSIENT_ERROR_PATTERNS)), re.IGNORECASE
+)
+
+
+class _StatusError(Exception):
+    """Base for retry classification errors carrying an HTTP status.
+
+    Attributes live in __slots__ so instances raised on every failed attempt
+    never allocate a per-instance __dict__.
     """
 
+    __slots__ = ("status_code", "original_error")
+
     def __init__(
         self,
         message: str,
         status_code: int | None = None,
         original_error: Exception | None = None,
     ) -> None:
-        """Initialize retryable error.
+        """Initialize the error.
 
         Args:
             message: Error message
@@ -96,29 +140,170 @@ class RetryableError(Exception):
         self.status_code = status_code
         self.original_error = original_error
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slot values aren't in __dict__, so pass them to __init__ explicitly
+        return (type(self), (*self.args, self.status_code, self.original_error))
+
+
+class RetryableError(_StatusError):
+    """Exception that indicates a retryable error.
 
-class PermanentError(Exception):
+    Use this to wrap errors that should trigger retry logic.
+    """
+
+    __slots__ = ()
+
+
+class PermanentError(_StatusError):
     """Exception that indicates a permanent error (should not retry).
 
     Use this to wrap errors that should fail immediately.
     """
 
-    def __init__(
-        self,
-        message: str,
-        status_code: int | None = None,
-        original_error: Exception | None = None,
-    ) -> None:
-        """Initialize permanent error.
+    __slots__ = ()
 
-        Args:
-            message: Error message
-            status_code: HTTP status code if applicable
-            original_error: Original exception that was caught
+
+class CircuitOpenError(PermanentError):
+    """Raised instead of calling a function while its circuit breaker is open."""
+
+    __slots__ = ()
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls are rejected until reset_timeout elapses
+    HALF_OPEN = "half_open"  # A single probe call decides whether to close
+
+
+@dataclass
+class CircuitBreaker:
+    """Failure-rate circuit breaker shared by calls to the same target.
+
+    The breaker trips once at least ``min_calls`` calls in the current window
+    have been recorded and the failure rate reaches ``failure_threshold``.
+    While open, calls are rejected without being attempted. After
+    ``reset_timeout`` seconds one probe call is let through; its outcome
+    closes the breaker again or re-opens it.
+
+    Attributes:
+        failure_threshold: Failure rate (0-1) that trips the breaker
+        min_calls: Minimum recorded calls before the rate is evaluated
+        window_size: Calls after which the counters start over
+        reset_timeout: Seconds to stay open before allowing a probe
+    """
+
+    failure_threshold: float = 0.5
+    min_calls: int = 5
+    window_size: int = 20
+    reset_timeout: float = 30.0
+    state: CircuitState = CircuitState.CLOSED
+    failure_count: int = 0
+    success_count: int = 0
+    opened_at: float = 0.0
+    _probe_in_flight: bool = field(default=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def allow(self) -> bool:
+        """Check whether a call may be attempted now."""
+        with self._lock:
+            if self.state is CircuitState.CLOSED:
+                return True
+            if self.state is CircuitState.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = CircuitState.HALF_OPEN
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def release(self) -> None:
+        """Abandon a call let through by allow() without recording an outcome.
+
+        Used when a call is cancelled or interrupted, so a half-open breaker
+        can admit a new probe instead of waiting forever for this one.
         """
-        super().__init__(message)
-        self.status_code = status_code
-        self.original_error = original_error
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            if self.state is CircuitState.HALF_OPEN:
+                self._close()
+                return
+            self.success_count += 1
+            self._roll_window()
+
+    def record_failure(self) -> None:
+        """Record a transient failure, tripping the breaker if needed."""
+        with self._lock:
+            if self.state is CircuitState.HALF_OPEN:
+                self._open()
+                return
+            self.failure_count += 1
+            calls = self.failure_count + self.success_count
+            if (
+                calls >= self.min_calls
+                and self.failure_count / calls >= self.failure_threshold
+            ):
+                self._open()
+                return
+            self._roll_window()
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self._reset_counts()
+
+    def _close(self) -> None:
+        self.state = CircuitState.CLOSED
+        self._reset_counts()
+
+    def _reset_counts(self) -> None:
+        self.failure_count = 0
+        self.success_count = 0
+        self._probe_in_flight = False
+
+    def _roll_window(self) -> None:
+        if self.failure_count + self.success_count >= self.window_size:
+            self._reset_counts()
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(key: str) -> CircuitBreaker:
+    """Get the shared circuit breaker for a target, creating it if needed.
+
+    Args:
+        key: Name of the target (e.g. an API host or function name)
+
+    Returns:
+        CircuitBreaker shared by every caller using the same key
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(key)
+        if breaker is None:
+            breaker = _circuit_breakers[key] = CircuitBreaker()
+        return breaker
+
+
+# Exact-type fast path for the most common errors. Subclasses (and anything
+# carrying an HTTP status) go through the full checks in is_transient_error
+_EXACT_TYPE_TRANSIENT: dict[type[Exception], bool] = {
+    RetryableError: True,
+    PermanentError: False,
+    CircuitOpenError: False,
+    ConnectionError: True,
+    TimeoutError: True,
+    OSError: True,
+}
 
 
 def is_transient_error(error: Exception) -> bool:
@@ -130,6 +315,10 @@ def is_transient_error(error: Exception) -> bool:
     Returns:
         True if the error is transient and should be retried
     """
+    transient = _EXACT_TYPE_TRANSIENT.get(type(error))
+    if transient is not None:
+        return transient
+
     # RetryableError is always transient
     if isinstance(error, RetryableError):
         return True
@@ -157,62 +346,147 @@ def is_transient_error(error: Exception) -> bool:
                 return False
 
     # Common network error types (transient)
-    transient_error_types = (
-        ConnectionError,
-        TimeoutError,
-        OSError,
-    )
-    if isinstance(error, transient_error_types):
+    if isinstance(error, TRANSIENT_ERROR_TYPES):
         return True
 
-    # Check error message for common transient patterns
-    error_str = str(error).lower()
-    transient_patterns = [
-        "timeout",
-        "connection refused",
-        "connection reset",
-        "temporarily unavailable",
-        "rate limit",
-        "throttl",
-        "overloaded",
-        "too many requests",
-    ]
-    # Return True if transient pattern found, otherwise False (fail fast)
-    return any(pattern in error_str for pattern in transient_patterns)
-
-
-def calculate_delay(attempt: int, config: RetryConfig) -> float:
+    # Check error message for common transient patterns; return True if one
+    # is found, otherwise False (fail fast)
+    return _TRANSIENT_MESSAGE_RE.search(str(error)) is not None
+
+
+def calculate_delay(
+    attempt: int, config: RetryConfig, rng: random.Random | None = None
+) -> float:
     """Calculate the delay before the next retry attempt.
 
-    Uses exponential backoff with optional jitter.
+    Uses exponential backoff with optional "full jitter": the delay is drawn
+    uniformly from [0, capped backoff], which spreads concurrent clients out
+    more than scaling a fixed delay does.
 
     Args:
         attempt: Current attempt number (0-indexed)
         config: Retry configuration
+        rng: Random generator for jitter (uses the module-level one if None)
 
     Returns:
         Delay in seconds
     """
-    # Exponential backoff: base_delay * (exponential_base ^ attempt)
-    delay = config.base_delay * (config.exponential_base**attempt)
+    # Exponential backoff: base_delay * (exponential_base ^ attempt), capped
+    cap = min(config.base_delay * (config.exponential_base**attempt), config.max_delay)
+
+    # Full jitter (random value between 0 and the capped delay)
+    if not config.jitter:
+        return cap
+    return (rng or random).uniform(0, cap)
+
+
+def iter_delays(
+    config: RetryConfig, rng: random.Random | None = None
+) -> Iterator[float]:
+    """Yield the delay before each retry allowed by a configuration.
+
+    Args:
+        config: Retry configuration
+        rng: Random generator for jitter (uses the module-level one if None)
 
-    # Cap at max_delay
-    delay = min(delay, config.max_delay)
+    Yields:
+        Delay in seconds before retry 1, 2, ... up to config.max_retries
+    """
+    for attempt in range(config.max_retries):
+        yield calculate_delay(attempt, config, rng)
+
+
+def _check_circuit(
+    circuit_breaker: CircuitBreaker | None,
+    func_name: str,
+    last_error: Exception | None,
+) -> None:
+    """Raise CircuitOpenError if the breaker rejects the next attempt."""
+    if circuit_breaker is not None and not circuit_breaker.allow():
+        raise CircuitOpenError(
+            f"Circuit open for {func_name}; call not attempted"
+        ) from last_error
+
+
+def _retry_delay(
+    error: Exception,
+    func_name: str,
+    attempt: int,
+    config: RetryConfig,
+    delays: Iterator[float],
+    circuit_breaker: CircuitBreaker | None,
+    deadline: float,
+) -> float | None:
+    """Decide how to handle a failed attempt.
 
-    # Add jitter (random value between 0 and delay)
-    if config.jitter:
-        delay = delay * (0.5 + random.random())
+    Args:
+        error: Exception raised by the attempt
+        func_name: Name of the wrapped function (for logging)
+        attempt: Number of the failed attempt (1-indexed)
+        config: Retry configuration
+        delays: Remaining retry delays from iter_delays()
+        circuit_breaker: Breaker to record transient failures on, if any
+        deadline: time.monotonic() value after which no retry is started
 
+    Returns:
+        Seconds to wait before retrying, or None if the error should be raised
+    """
+    if not is_transient_error(error):
+        # The target answered, so a permanent error counts as healthy for the
+        # breaker (and settles a half-open probe)
+        if circuit_breaker is not None:
+            circuit_breaker.record_success()
+        logger.warning("Permanent error in %s: %s (not retrying)", func_name, error)
+        return None
+
+    if circuit_breaker is not None:
+        circuit_breaker.record_failure()
+
+    delay = next(delays, None)
+    if delay is None:
+        logger.error(
+            "Max retries (%d) exceeded for %s: %s",
+            config.max_retries,
+            func_name,
+            error,
+        )
+        return None
+
+    # A retry that could only start at or after the deadline is pointless, so
+    # give up now rather than sleeping out the rest of the budget first
+    if time.monotonic() + delay >= deadline:
+        logger.error(
+            "Retry deadline (%.2fs) exceeded for %s: %s",
+            config.total_deadline,
+            func_name,
+            error,
+        )
+        return None
+
+    # Retries can fire at a high rate; skip building the record when INFO is off
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Transient error in %s (attempt %d/%d): %s. Retrying in %.2fs",
+            func_name,
+            attempt,
+            config.max_retries + 1,
+            error,
+            delay,
+        )
     return delay
 
 
 def with_retry(
     config: RetryConfig | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Decorator for retrying synchronous functions on transient failures.
 
     Args:
-        config: Retry configuration (uses defaults if None)
+        config: Retry configuration (if None, the default for the calling
+            context is looked up on each call)
+        circuit_breaker: Optional breaker; while open, calls raise
+            CircuitOpenError immediately instead of being attempted
 
     Returns:
         Decorated function that retries on transient errors
@@ -224,66 +498,89 @@ def with_retry(
             response.raise_for_status()
             return response.json()
     """
-    if config is None:
-        config = RetryConfig()
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        # Independent generator per wrapped function so concurrent retries
+        # don't share the module-level generator's state
+        rng = random.Random()
+        func_name = func.__name__
+
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            # Resolved per call so a context's default applies to functions
+            # decorated before it was set
+            retry_config = config if config is not None else get_default_retry_config()
+            delays = iter_delays(retry_config, rng)
+            deadline = (
+                time.monotonic() + retry_config.total_deadline
+                if retry_config.total_deadline is not None
+                else math.inf
+            )
             last_error: Exception | None = None
+            attempt = 0
+
+            while True:
+                _check_circuit(circuit_breaker, func_name, last_error)
+                attempt += 1
 
-            for attempt in range(config.max_retries + 1):
                 try:
-                    return func(*args, **kwargs)
+                    result = func(*args, **kwargs)
                 except Exception as e:
-                    last_error = e
-
-                    if not is_transient_error(e):
-                        logger.warning(
-                            "Permanent error in %s: %s (not retrying)",
-                            func.__name__,
-                            e,
-                        )
-                        raise
-
-                    if attempt >= config.max_retries:
-                        logger.error(
-                            "Max retries (%d) exceeded for %s: %s",
-                            config.max_retries,
-                            func.__name__,
-                            e,
-                        )
-                        raise
-
-                    delay = calculate_delay(attempt, config)
-                    logger.info(
-                        "Transient error in %s (attempt %d/%d): %s. "
-                        "Retrying in %.2fs",
-                        func.__name__,
-                        attempt + 1,
-                        config.max_retries + 1,
+                    delay = _retry_delay(
                         e,
-                        delay,
+                        func_name,
+                        attempt,
+                        retry_config,
+                        delays,
+                        circuit_breaker,
+                        deadline,
                     )
+                    if delay is None:
+                        raise
+                    last_error = e
                     time.sleep(delay)
-
-            # Should not reach here, but satisfy type checker
-            if last_error:
-                raise last_error
-            raise RuntimeError("Unexpected retry loop exit")
+                except BaseException:
+                    # KeyboardInterrupt/SystemExit (e.g. SIGTERM) mid-call: free
+                    # the probe slot so a half-open breaker isn't stuck
+                    if circuit_breaker is not None:
+                        circuit_breaker.release()
+                    raise
+                else:
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_success()
+                    return result
 
         return wrapper
 
     return decorator
 
 
+def _coalesce_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable | None:
+    """Build a hashable key for a call's arguments, or None if unhashable."""
+    key = (asyncio.get_running_loop(), args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def with_async_retry(
     config: RetryConfig | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    coalesce: bool = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Decorator for retrying async functions on transient failures.
 
     Args:
-        config: Retry configuration (uses defaults if None)
+        config: Retry configuration (if None, the default for the calling
+            context is looked up on each call)
+        circuit_breaker: Optional breaker; while open, calls raise
+            CircuitOpenError immediately instead of being attempted
+        coalesce: If True, a call made while an identical call (same
+            hashable arguments) is in flight awaits that call's outcome
+            instead of issuing and retrying its own. Only use for
+            side-effect-free calls.
 
     Returns:
         Decorated async function that retries on transient errors
@@ -296,80 +593,175 @@ def with_async_retry(
                     response.raise_for_status()
                     return await response.json()
     """
-    if config is None:
-        config = RetryConfig()
 
     def decorator(func: Callable[P, Any]) -> Callable[P, Any]:
-        @functools.wraps(func)
-        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+        # Independent generator per wrapped function so concurrent retries
+        # don't share the module-level generator's state
+        rng = random.Random()
+        func_name = func.__name__
+        in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+
+        async def call_with_retry(*args: P.args, **kwargs: P.kwargs) -> Any:
+            # Resolved per call so a context's default applies to functions
+            # decorated before it was set
+            retry_config = config if config is not None else get_default_retry_config()
+            delays = iter_delays(retry_config, rng)
+            deadline = (
+                time.monotonic() + retry_config.total_deadline
+                if retry_config.total_deadline is not None
+                else math.inf
+            )
             last_error: Exception | None = None
+            attempt = 0
+
+            while True:
+                _check_circuit(circuit_breaker, func_name, last_error)
+                attempt += 1
 
-            for attempt in range(config.max_retries + 1):
                 try:
-                    return await func(*args, **kwargs)
+                    result = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    # Never retry a cancellation (e.g. from wait_for/TaskGroup)
+                    if circuit_breaker is not None:
+                        circuit_breaker.release()
+                    raise
+                except (KeyboardInterrupt, SystemExit):
+                    if circuit_breaker is not None:
+                        circuit_breaker.release()
+                    raise
                 except Exception as e:
-                    last_error = e
-
-                    if not is_transient_error(e):
-                        logger.warning(
-                            "Permanent error in %s: %s (not retrying)",
-                            func.__name__,
-                            e,
-                        )
-                        raise
-
-                    if attempt >= config.max_retries:
-                        logger.error(
-                            "Max retries (%d) exceeded for %s: %s",
-                            config.max_retries,
-                            func.__name__,
-                            e,
-                        )
-                        raise
-
-                    delay = calculate_delay(attempt, config)
-                    logger.info(
-                        "Transient error in %s (attempt %d/%d): %s. "
-                        "Retrying in %.2fs",
-                        func.__name__,
-                        attempt + 1,
-                        config.max_retries + 1,
+                    delay = _retry_delay(
                         e,
-                        delay,
+                        func_name,
+                        attempt,
+                        retry_config,
+                        delays,
+                        circuit_breaker,
+                        deadline,
                     )
+                    if delay is None:
+                        raise
+                    last_error = e
                     await asyncio.sleep(delay)
+                else:
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_success()
+                    return result
 
-            # Should not reach here, but satisfy type checker
-            if last_error:
-                raise last_error
-            raise RuntimeError("Unexpected retry loop exit")
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            key = _coalesce_key(args, kwargs) if coalesce else None
+            if key is None:
+                return await call_with_retry(*args, **kwargs)
+
+            pending = in_flight.get(key)
+            if pending is not None:
+                # Shield so cancelling this waiter doesn't cancel the others
+                try:
+                    return await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    # If only the leader was cancelled, make the call ourselves
+                    # rather than failing with someone else's cancellation
+                    task = asyncio.current_task()
+                    if not pending.cancelled() or (task and task.cancelling()):
+                        raise
+                    return await call_with_retry(*args, **kwargs)
+
+            pending = in_flight[key] = asyncio.get_running_loop().create_future()
+            try:
+                result = await call_with_retry(*args, **kwargs)
+            except asyncio.CancelledError:
+                pending.cancel()
+                raise
+            except Exception as e:
+                pending.set_exception(e)
+                pending.exception()  # Mark retrieved when nobody else waits
+                raise
+            else:
+                pending.set_result(result)
+                return result
+            finally:
+                del in_flight[key]
 
         return wrapper
 
     return decorator
 
 
-# Default retry configuration (can be overridden via config file)
-_default_config: RetryConfig = RetryConfig()
+_sessions: dict[int, "requests.Session"] = {}
+_sessions_lock = threading.Lock()
+
+
+def pooled_session(pool_size: int = 10) -> "requests.Session":
+    """Get a shared requests.Session backed by a keep-alive connection pool.
+
+    Reusing one session across calls (and across retries of the same call)
+    avoids a new TCP/TLS handshake per request to the same host.
+
+    Args:
+        pool_size: Connections kept per host (sessions are shared per size)
+
+    Returns:
+        Session shared by every caller asking for the same pool size
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    with _sessions_lock:
+        session = _sessions.get(pool_size)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[pool_size] = session
+        return session
+
+
+# Default retry configuration (can be overridden via config file). The
+# process-wide default is a plain module global so every thread sees it; a
+# ContextVar lets a task install its own default on top without affecting others
+_process_default_config = RetryConfig()
+_default_config: ContextVar[RetryConfig | None] = ContextVar(
+    "retry_default_config", default=None
+)
 
 
 def get_default_retry_config() -> RetryConfig:
-    """Get the default retry configuration.
+    """Get the default retry configuration for the current context.
 
     Returns:
-        Default RetryConfig instance
+        The context's override if one is set, otherwise the process-wide
+        default installed by init_retry_config()
     """
-    return _default_config
+    config = _default_config.get()
+    return config if config is not None else _process_default_config
 
 
-def set_default_retry_config(config: RetryConfig) -> None:
-    """Set the default retry configuration.
+def set_default_retry_config(config: RetryConfig) -> Token[RetryConfig | None]:
+    """Override the default retry configuration for the current context.
+
+    The override applies to the current thread or task and to tasks
+    created from it afterwards (contextvars semantics), not to ones already
+    running or to other threads. Use init_retry_config() to change the
+    process-wide default.
 
     Args:
         config: New default configuration
+
+    Returns:
+        Token that can be passed to reset_default_retry_config()
     """
-    global _default_config
-    _default_config = config
+    return _default_config.set(config)
+
+
+def reset_default_retry_config(token: Token[RetryConfig | None]) -> None:
+    """Restore the default configuration that was replaced by a set call.
+
+    Args:
+        token: Token returned by set_default_retry_config()
+    """
+    _default_config.reset(token)
 
 
 def init_retry_config(
@@ -377,7 +769,12 @@ def init_retry_config(
     base_delay: float | None = None,
     max_delay: float | None = None,
 ) -> RetryConfig:
-    """Initialize retry configuration from parameters.
+    """Initialize the process-wide retry configuration from parameters.
+
+    The new default is seen by every thread and task that has no override
+    from set_default_retry_config(). Decorators without an explicit config
+    look the default up on every call, so this also applies to functions
+    decorated earlier.
 
     Args:
         max_retries: Maximum retry attempts
@@ -392,5 +789,6 @@ def init_retry_config(
         base_delay=base_delay if base_delay is not None else 1.0,
         max_delay=max_delay if max_delay is not None else 60.0,
     )
-    set_default_retry_config(config)
+    global _process_default_config
+    _process_default_config = config
     return config
@@ -4,11 +4,20 @@ Provides functions to fetch secrets from AWS Secrets Manager,
 including Anthropic API keys, Bedrock API keys, and GitHub tokens.
 """
 
+import contextlib
+import functools
+import logging
 import os
+import tempfile
+import time
 from pathlib import Path
+from typing import Any
 
 from .config import get_boto3_client
 
+
+logger = logging.getLogger(__name__)
+
 # File paths for git hook communication
 GITHUB_TOKEN_FILE = Path("/tmp/github_token.txt")
 
@@ -16,10 +25,38 @@ GITHUB_TOKEN_FILE = Path("/tmp/github_token.txt")
 # See: https://docs.aws.amazon.com/bedrock/latest/userguide/api-keys-use.html
 BEDROCK_API_KEY_ENV_VAR = "AWS_BEARER_TOKEN_BEDROCK"
 
+# Fetched secrets are reused for this long before hitting Secrets Manager again,
+# so rotated secrets are still picked up by long-running processes
+SECRET_CACHE_TTL_SECONDS = 300.0
+
+# (secret_name, profile) -> (monotonic fetch time, secret value)
+_secret_cache: dict[tuple[str, str | None], tuple[float, str]] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _secrets_manager_client(profile: str | None) -> Any:
+    """Get a Secrets Manager client, built once per profile.
+
+    Creating a boto3 client loads the service model and resolves endpoints,
+    which costs far more than the lookups themselves. Clients are thread-safe.
+    """
+    return get_boto3_client("secretsmanager", profile=profile)
+
+
+def _cached_secret(secret_name: str, profile: str | None) -> str | None:
+    """Return a cached secret that is still within its TTL, else None."""
+    cached = _secret_cache.get((secret_name, profile))
+    if cached is not None and time.monotonic() - cached[0] < SECRET_CACHE_TTL_SECONDS:
+        return cached[1]
+    return None
+
 
 def get_secret(secret_name: str, profile: str | None = None) -> str | None:
     """Fetch secret from AWS Secrets Manager.
 
+    Successful lookups are cached for SECRET_CACHE_TTL_SECONDS; failures are
+    not cached.
+
     Args:
         secret_name: Name of the secret
         profile: AWS profile name (optional, falls back to AWS_PROFILE env var)
@@ -27,14 +64,69 @@ def get_secret(secret_name: str, profile: str | None = None) -> str | None:
     Returns:
         Secret value or None if failed
     """
+    cached = _cached_secret(secret_name, profile)
+    if cached is not None:
+        return cached
+
     try:
-        client = get_boto3_client("secretsmanager", profile=profile)
+        client = _secrets_manager_client(profile)
         response = client.get_secret_value(SecretId=secret_name)
-        return response["SecretString"]
+        secret = response["SecretString"]
     except Exception as e:
-        print(f"❌ Failed to fetch secret {secret_name}: {e}")
+        logger.error("Failed to fetch secret %s: %s", secret_name, e)
         return None
 
+    _secret_cache[(secret_name, profile)] = (time.monotonic(), secret)
+    return secret
+
+
+def prefetch_secrets(secret_names: list[str], profile: str | None = None) -> dict[str, str]:
+    """Fetch several secrets with one BatchGetSecretValue call and cache them.
+
+    Secrets still in the cache are returned without a call; only missing or
+    expired ones are fetched. Secrets that are missing or unreadable are left
+    out of the result (and the cache), so a later get_secret() for them
+    behaves as before.
+
+    Args:
+        secret_names: Secret names to fetch (at most 20)
+        profile: AWS profile name (optional, falls back to AWS_PROFILE env var)
+
+    Returns:
+        Mapping of secret name to value for the secrets that were found, or
+        an empty dict if the batch call failed
+    """
+    found: dict[str, str] = {}
+    to_fetch: list[str] = []
+    for name in secret_names:
+        cached = _cached_secret(name, profile)
+        if cached is not None:
+            found[name] = cached
+        else:
+            to_fetch.append(name)
+    if not to_fetch:
+        return found
+
+    try:
+        client = _secrets_manager_client(profile)
+        response = client.batch_get_secret_value(SecretIdList=to_fetch)
+    except Exception as e:
+        logger.warning("Batch secret fetch failed, using individual lookups: %s", e)
+        return {}
+
+    fetched_at = time.monotonic()
+    for item in response.get("SecretValues", []):
+        secret = item.get("SecretString")
+        if secret is not None:
+            found[item["Name"]] = secret
+            _secret_cache[(item["Name"], profile)] = (fetched_at, secret)
+    return found
+
+
+def clear_secret_cache() -> None:
+    """Drop all cached secrets so the next lookups refetch them."""
+    _secret_cache.clear()
+
 
 def get_anthropic_api_key(environment: str | None = None) -> str | None:
     """Fetch Anthropic API key from Secrets Manager.
@@ -84,17 +176,21 @@ def get_github_token(github_repo: str | None = None, environment: str | None = N
     """
     env = environment or os.environ.get("ENVIRONMENT", "reinvent")
     repo = github_repo or os.environ.get("GITHUB_REPOSITORY", "")
+    default_secret = f"claude-code/{env}/github-token"
 
     # Try org-specific token first (e.g., claude-code/reinvent/github-token-anthropics)
     if repo and "/" in repo:
         org = repo.split("/")[0]
-        token = get_secret(f"claude-code/{env}/github-token-{org}")
+        org_secret = f"claude-code/{env}/github-token-{org}"
+        # Fetch both candidates in one round-trip; the default lands in the cache
+        found = prefetch_secrets([org_secret, default_secret])
+        token = found.get(org_secret) if found else get_secret(org_secret)
         if token:
             print(f"✅ Using org-specific GitHub token for {org}")
             return token
 
     # Fall back to default token
-    return get_secret(f"claude-code/{env}/github-token")
+    return get_secret(default_secret)
 
 
 def write_github_token_to_file(github_token: str) -> bool:
@@ -109,13 +205,25 @@ def write_github_token_to_file(github_token: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    tmp_path = None
     try:
-        GITHUB_TOKEN_FILE.write_text(github_token)
-        # Set restrictive permissions
-        GITHUB_TOKEN_FILE.chmod(0o600)
+        # mkstemp creates a fresh 0600 file with O_EXCL, so the token is never
+        # readable by others and a pre-planted file or symlink at the fixed
+        # path is never opened; os.replace then swaps it in atomically
+        fd, tmp_path = tempfile.mkstemp(
+            dir=GITHUB_TOKEN_FILE.parent, prefix=f".{GITHUB_TOKEN_FILE.name}."
+        )
+        try:
+            os.write(fd, github_token.encode("utf-8"))
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, GITHUB_TOKEN_FILE)
         return True
     except Exception as e:
-        print(f"❌ Failed to write GitHub token file: {e}")
+        logger.error("Failed to write GitHub token file: %s", e)
+        if tmp_path:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
         return False
 
 
@@ -126,12 +234,12 @@ def read_github_token_from_file() -> str | None:
         GitHub token or None if file doesn't exist or is empty
     """
     try:
-        if GITHUB_TOKEN_FILE.exists():
-            token = GITHUB_TOKEN_FILE.read_text().strip()
-            return token if token else None
+        token = GITHUB_TOKEN_FILE.read_text().strip()
+        return token if token else None
+    except FileNotFoundError:
         return None
     except Exception as e:
-        print(f"❌ Failed to read GitHub token file: {e}")
+        logger.error("Failed to read GitHub token file: %s", e)
         return None
 
 
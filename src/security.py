@@ -1,10 +1,16 @@
 """Security utilities for Claude Code."""
 
-import glob
+import atexit
+import functools
 import json
+import logging
 import os
 import re
-from datetime import datetime, timezone
+import shlex
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +26,136 @@ from .config import (
 from .error_messages import SecurityErrorMessages
 
 
+logger = logging.getLogger(__name__)
+
+
+class _PrintHandler(logging.Handler):
+    """Emit records through print() so they reach the timestamped log tee."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            print(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+_console_handler: _PrintHandler | None = None
+
+
+def configure_console_logging() -> None:
+    """Show this module's INFO messages (allowed commands, tracked screenshots).
+
+    The app configures no logging handlers, so without this they would fall
+    through to logging's last-resort handler, which drops anything below
+    WARNING. Safe to call more than once.
+    """
+    global _console_handler
+
+    if _console_handler is not None:
+        return
+    _console_handler = _PrintHandler(logging.INFO)
+    logger.addHandler(_console_handler)
+    logger.setLevel(logging.INFO)
+
+# orjson is an optional speedup for reading and writing verification state
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _compile_alternation(patterns: list[str]) -> re.Pattern[str]:
+    """Combine patterns into one case-insensitive regex matching any of them."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Blocked command patterns from config, each list compiled once at import into
+# a single alternation so a command is scanned once rather than per pattern
+_BLOCKED_SED_RE = _compile_alternation(BLOCKED_SED_PATTERNS)
+_BLOCKED_FEATURE_LIST_RE = _compile_alternation(BLOCKED_FEATURE_LIST_PATTERNS)
+
+# Allow lists in display order for error messages, built once instead of per block
+_ALLOWED_BASH_LIST = sorted(ALLOWED_BASH_COMMANDS)
+_ALLOWED_PKILL_LIST = sorted(ALLOWED_PKILL_PATTERNS)
+
+# Commands that commonly take file paths as arguments
+_PATH_SENSITIVE_COMMANDS = frozenset(
+    {
+        "cat",
+        "less",
+        "more",
+        "head",
+        "tail",
+        "file",
+        "stat",
+        "cp",
+        "mv",
+        "rm",
+        "mkdir",
+        "rmdir",
+        "touch",
+        "chmod",
+        "chown",
+        "ls",
+        "find",
+        "locate",
+        "grep",
+        "egrep",
+        "fgrep",
+        "vi",
+        "vim",
+        "nano",
+        "emacs",
+        "gedit",
+        "git",
+        "python",
+        "python3",
+        "node",
+        "npm",
+        "pip",
+        "tar",
+        "unzip",
+        "zip",
+        "gzip",
+        "gunzip",
+        "curl",
+        "wget",
+        "scp",
+        "rsync",
+    }
+)
+
+# Bash arguments that look like paths: contain a slash (/, ./, ../, ~/...) or
+# look like a file name with one or two dots (basic file extension check)
+_PATH_SHAPE_RE = re.compile(r"/|^[^.]*\.[^.]*(?:\.[^.]*)?\Z")
+
+# Path-shaped arguments that are really URLs or shell operators
+_NOT_A_PATH_RE = re.compile(
+    "|".join(
+        re.escape(pattern)
+        for pattern in [
+            "http://",
+            "https://",
+            "ftp://",
+            "|",
+            ">",
+            "<",
+            "&&",
+            "||",
+            "/dev/null",  # Allow /dev/null for redirection
+        ]
+    )
+)
+
+# Test ID extraction from feature_list.json edits
+_ID_RE = re.compile(r'"id"\s*:\s*"([^"]+)"')
+_NAME_RE = re.compile(r'"name"\s*:\s*"([^"]+)"')
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+_PASSES_TRUE_RE = re.compile(r"""["']passes["']\s*:\s*true""")
+
+
 # ============================================================================
 # Screenshot Verification State (with persistence)
 # ============================================================================
@@ -30,14 +166,43 @@ from .error_messages import SecurityErrorMessages
 # F025: State is now persisted to JSON file for session continuity.
 # Stale screenshots (>24h) are filtered out on load.
 
+# Paths are stored absolute and normalized (see _normalize_screenshot_path)
 _viewed_screenshots: set[str] = set()
-_verification_state_file: str | None = None
+_verification_state_file: Path | None = None
 _STALE_THRESHOLD_HOURS = 24
 
+# State lives in memory during the session and is written back by a background
+# thread every _FLUSH_INTERVAL_SECONDS while it has changes, at interpreter exit,
+# or by an explicit flush_verification_state() from the caller's shutdown path,
+# so no JSON encoding or file I/O happens on the tool-call path
+_FLUSH_INTERVAL_SECONDS = 30.0
+_state_lock = threading.Lock()  # guards changes to _viewed_screenshots
+_save_lock = threading.Lock()  # serializes writers of the state file
+_state_version = 0  # bumped on every change to _viewed_screenshots
+_saved_version = 0  # _state_version last written to disk
+_state_dir_ready = False
+_flush_registered = False
+
+
+def _normalize_screenshot_path(file_path: str) -> str:
+    """Normalize a screenshot path so equivalent spellings compare equal.
+
+    Args:
+        file_path: Path as given by the agent or found on disk
+
+    Returns:
+        Absolute, normalized path (``./`` and ``..`` segments collapsed)
+    """
+    return os.path.abspath(file_path)
+
 
+@functools.lru_cache(maxsize=4)
 def _get_verification_state_path(project_root: str) -> Path | None:
     """Get path to verification state file.
 
+    ISSUE_NUMBER is fixed for a session, so it is read on the first call per
+    project root; clear_screenshot_tracking() resets the cache.
+
     Args:
         project_root: Project root directory
 
@@ -59,70 +224,162 @@ def _load_verification_state(state_path: Path) -> dict[str, Any]:
     Returns:
         State dict with viewed_screenshots list and timestamps
     """
-    if not state_path.exists():
+    try:
+        with open(state_path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return {"viewed_screenshots": {}}
+    except OSError as e:
+        logger.warning("Failed to load verification state: %s", e)
         return {"viewed_screenshots": {}}
 
     try:
-        with open(state_path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        print(f"⚠️ Failed to load verification state: {e}")
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    except json.JSONDecodeError as e:
+        logger.warning("Failed to load verification state: %s", e)
         return {"viewed_screenshots": {}}
 
 
-def _save_verification_state(state_path: Path, viewed: set[str]) -> None:
+def _save_verification_state(state_path: Path, viewed: set[str]) -> bool:
     """Save verification state to JSON file.
 
     Args:
         state_path: Path to state file
         viewed: Set of viewed screenshot paths
+
+    Returns:
+        True if the state file was replaced, False if saving failed
     """
-    # Ensure directory exists
-    state_path.parent.mkdir(parents=True, exist_ok=True)
+    global _state_dir_ready
+
+    # Ensure directory exists (once per process)
+    if not _state_dir_ready:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        _state_dir_ready = True
 
-    # Create state dict with timestamps
-    now = datetime.now(timezone.utc).isoformat()
+    # Create state dict with timestamps (schema 2: integer Unix epoch seconds)
+    now = int(time.time())
     state = {
+        "schema": 2,
         "last_updated": now,
         "viewed_screenshots": {
             path: now for path in viewed
         }
     }
 
+    # Serialize up front and swap the file in atomically, so a crash mid-write
+    # never leaves a truncated state file behind
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(state)
+    else:
+        payload = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
     try:
-        with open(state_path, "w") as f:
-            json.dump(state, f, indent=2)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, state_path)
     except OSError as e:
-        print(f"⚠️ Failed to save verification state: {e}")
+        logger.warning("Failed to save verification state: %s", e)
+        return False
+    return True
 
 
-def _filter_stale_screenshots(viewed_dict: dict[str, str]) -> set[str]:
+def _filter_stale_screenshots(viewed_dict: dict[str, int | str]) -> set[str]:
     """Filter out screenshots viewed more than 24 hours ago.
 
     Args:
-        viewed_dict: Dict mapping path -> ISO timestamp
+        viewed_dict: Dict mapping path -> epoch seconds (or ISO timestamp
+            in state files written before schema 2)
 
     Returns:
         Set of non-stale screenshot paths
     """
-    now = datetime.now(timezone.utc)
+    cutoff = time.time() - _STALE_THRESHOLD_HOURS * 3600
     result = set()
 
-    for path, timestamp_str in viewed_dict.items():
-        try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            age_hours = (now - timestamp).total_seconds() / 3600
-            if age_hours < _STALE_THRESHOLD_HOURS:
-                result.add(path)
-            else:
-                print(f"📸 Filtered stale screenshot (>{_STALE_THRESHOLD_HOURS}h): {path}")
-        except (ValueError, TypeError):
+    for path, timestamp in viewed_dict.items():
+        if isinstance(timestamp, str):
+            # Schema 1 state file: timezone-aware ISO 8601 timestamps
+            try:
+                parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            if parsed.tzinfo is None:
+                continue
+            timestamp = parsed.timestamp()
+        elif not isinstance(timestamp, int | float) or isinstance(timestamp, bool):
             # Invalid timestamp, skip this entry
-            pass
+            continue
+
+        if timestamp > cutoff:
+            result.add(path)
+        else:
+            logger.info(
+                "📸 Filtered stale screenshot (>%sh): %s", _STALE_THRESHOLD_HOURS, path
+            )
 
     return result
 
 
+def _set_verification_state_file(state_path: Path) -> None:
+    """Remember where state is persisted and make sure it is flushed.
+
+    The first call registers an atexit flush and starts the periodic flusher.
+
+    Args:
+        state_path: Path to state file
+    """
+    global _verification_state_file, _state_dir_ready, _flush_registered
+
+    with _save_lock:
+        if _verification_state_file != state_path:
+            _verification_state_file = state_path
+            _state_dir_ready = False
+    if not _flush_registered:
+        atexit.register(flush_verification_state)
+        threading.Thread(
+            target=_flush_periodically, name="verification-state-flusher", daemon=True
+        ).start()
+        _flush_registered = True
+
+
+def _flush_periodically() -> None:
+    """Flush changed state every _FLUSH_INTERVAL_SECONDS (daemon thread body).
+
+    Bounds what a SIGKILL or OOM kill can lose, since neither runs atexit.
+    """
+    # Waiting on an Event that is never set, rather than time.sleep, keeps the
+    # loop unaffected when time.sleep is monkeypatched
+    idle = threading.Event()
+    while True:
+        idle.wait(_FLUSH_INTERVAL_SECONDS)
+        flush_verification_state()
+
+
+def flush_verification_state() -> None:
+    """Write screenshot tracking state to disk if it changed since the last save.
+
+    Runs periodically in the background and at exit once a state file is
+    known; callers with their own shutdown path (e.g. a SIGTERM handler)
+    should call it there too. State stays dirty if the write fails.
+    """
+    global _saved_version
+
+    with _save_lock:
+        with _state_lock:
+            if _state_version == _saved_version or _verification_state_file is None:
+                return
+            version = _state_version
+            snapshot = set(_viewed_screenshots)
+        if _save_verification_state(_verification_state_file, snapshot):
+            with _state_lock:
+                _saved_version = max(_saved_version, version)
+
+
 def initialize_screenshot_tracking(project_root: str | None) -> None:
     """Initialize screenshot tracking, loading persisted state if available.
 
@@ -131,17 +388,22 @@ def initialize_screenshot_tracking(project_root: str | None) -> None:
     Args:
         project_root: Project root directory
     """
-    global _viewed_screenshots, _verification_state_file
+    global _viewed_screenshots
 
+    configure_console_logging()
     if not project_root:
         return
 
     state_path = _get_verification_state_path(project_root)
     if state_path:
-        _verification_state_file = str(state_path)
+        _set_verification_state_file(state_path)
         state = _load_verification_state(state_path)
         viewed_dict = state.get("viewed_screenshots", {})
-        _viewed_screenshots = _filter_stale_screenshots(viewed_dict)
+        restored = set(
+            map(_normalize_screenshot_path, _filter_stale_screenshots(viewed_dict))
+        )
+        with _state_lock:
+            _viewed_screenshots = restored
 
         if _viewed_screenshots:
             print(f"📸 Restored {len(_viewed_screenshots)} viewed screenshot(s) from previous session")
@@ -154,22 +416,21 @@ def track_screenshot_read(file_path: str, project_root: str | None = None) -> No
         file_path: Path to the screenshot/console file that was read
         project_root: Project root directory for persistence (optional)
     """
-    global _verification_state_file
+    global _state_version
 
     if "screenshots/" in file_path:
         if file_path.endswith(".png") or file_path.endswith("-console.txt"):
-            _viewed_screenshots.add(file_path)
+            with _state_lock:
+                _viewed_screenshots.add(_normalize_screenshot_path(file_path))
+                _state_version += 1
             file_type = "screenshot" if file_path.endswith(".png") else "console log"
-            print(f"📸 Tracked {file_type} view: {file_path}")
+            logger.info("📸 Tracked %s view: %s", file_type, file_path)
 
-            # F025: Persist state after each track operation
-            if _verification_state_file:
-                _save_verification_state(Path(_verification_state_file), _viewed_screenshots)
-            elif project_root:
+            # F025: Persisted periodically and at exit once the file is known
+            if not _verification_state_file and project_root:
                 state_path = _get_verification_state_path(project_root)
                 if state_path:
-                    _verification_state_file = str(state_path)
-                    _save_verification_state(state_path, _viewed_screenshots)
+                    _set_verification_state_file(state_path)
 
 
 def was_screenshot_viewed(file_path: str) -> bool:
@@ -181,12 +442,72 @@ def was_screenshot_viewed(file_path: str) -> bool:
     Returns:
         True if the screenshot was previously read by the agent
     """
-    return file_path in _viewed_screenshots
+    return _normalize_screenshot_path(file_path) in _viewed_screenshots
 
 
 def clear_screenshot_tracking() -> None:
     """Clear the screenshot tracking state (for testing/reset)."""
-    _viewed_screenshots.clear()
+    global _saved_version
+
+    with _state_lock:
+        _viewed_screenshots.clear()
+        _saved_version = _state_version
+    _get_verification_state_path.cache_clear()
+
+
+# Screenshots in the issue directory grouped by test ID, rebuilt only when the
+# directory's mtime changes (i.e. a file was added, removed or renamed)
+_screenshot_index: dict[str, list[str]] | None = None
+_screenshot_index_dir: str | None = None
+_screenshot_index_mtime: int = 0
+
+
+def _get_screenshot_index(dir_path: str) -> dict[str, list[str]]:
+    """Get the screenshots in a directory, keyed by test ID.
+
+    A file like ``nav-menu-1700000000.png`` is listed under every prefix ending
+    at a ``-`` (``nav`` and ``nav-menu``), so a lookup matches the same files as
+    ``glob("{test_id}-*.png")`` for test IDs that themselves contain dashes.
+
+    Args:
+        dir_path: Screenshot directory for the current issue
+
+    Returns:
+        Mapping of test ID to screenshot paths (empty if the directory is missing)
+    """
+    global _screenshot_index, _screenshot_index_dir, _screenshot_index_mtime
+
+    try:
+        mtime = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        return {}
+
+    if (
+        _screenshot_index is not None
+        and _screenshot_index_dir == dir_path
+        and _screenshot_index_mtime == mtime
+    ):
+        return _screenshot_index
+
+    index: dict[str, list[str]] = {}
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or not name.endswith(".png"):
+                continue
+            dash = name.find("-")
+            while dash != -1:
+                index.setdefault(name[:dash], []).append(entry.path)
+                dash = name.find("-", dash + 1)
+
+    # A file created within the mtime's timestamp granularity of this scan
+    # would not change it, so only trust the index once the directory has
+    # been quiet for a moment
+    if time.time_ns() - mtime > 1_000_000_000:
+        _screenshot_index = index
+        _screenshot_index_dir = dir_path
+        _screenshot_index_mtime = mtime
+    return index
 
 
 def _extract_test_id(old_string: str, new_string: str) -> str | None:
@@ -203,25 +524,59 @@ def _extract_test_id(old_string: str, new_string: str) -> str | None:
     Returns:
         Test ID if found, None otherwise
     """
-    # Combine old and new strings for context
-    context = old_string + new_string
+    # Search old then new string in place rather than concatenating them,
+    # which copies the whole edit for large MultiEdit inputs
+    contexts = (old_string, new_string)
 
     # Try to find "id": "xxx" pattern
-    id_match = re.search(r'"id"\s*:\s*"([^"]+)"', context)
-    if id_match:
-        return id_match.group(1)
+    for context in contexts:
+        id_match = _ID_RE.search(context)
+        if id_match:
+            return id_match.group(1)
 
     # Try to find "name": "xxx" and slugify it
-    name_match = re.search(r'"name"\s*:\s*"([^"]+)"', context)
-    if name_match:
-        name = name_match.group(1)
-        # Convert to slug: "First Time User" -> "first-time-user"
-        slug = re.sub(r"[^a-zA-Z0-9]+", "-", name.lower()).strip("-")
-        return slug
+    for context in contexts:
+        name_match = _NAME_RE.search(context)
+        if name_match:
+            name = name_match.group(1)
+            # Convert to slug: "First Time User" -> "first-time-user"
+            slug = _SLUG_RE.sub("-", name.lower()).strip("-")
+            return slug
 
     return None
 
 
+# File operation tools checked by the universal path hook, mapped to how the
+# path to validate is read from their input
+_TOOL_PATH_EXTRACTORS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "Read": lambda tool_input: tool_input.get("file_path"),
+    "Edit": lambda tool_input: tool_input.get("file_path"),
+    "Write": lambda tool_input: tool_input.get("file_path"),
+    "MultiEdit": lambda tool_input: tool_input.get("file_path"),
+    # Glob and Grep validate the base/search path
+    "Glob": lambda tool_input: tool_input.get("path", "."),
+    "Grep": lambda tool_input: tool_input.get("path", "."),
+}
+
+# Audit log operation names; other file tools are logged as "write"
+_TOOL_OPERATIONS = {"Read": "read", "Edit": "edit"}
+
+_EDITING_TOOLS = frozenset({"Edit", "Write", "MultiEdit"})
+
+
+@functools.lru_cache(maxsize=8)
+def _resolved_root(project_root: str) -> Path:
+    """Resolve a project root once; it doesn't move during a session.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Absolute path with symlinks resolved
+    """
+    return Path(project_root).resolve()
+
+
 def _deny_response(reason: str) -> dict[str, Any]:
     """Create a deny response for PreToolUse hooks.
 
@@ -262,21 +617,25 @@ class SecurityValidator:
 
         try:
             # Resolve absolute paths to handle relative paths and symlinks
-            project_root_resolved = Path(project_root).resolve()
+            project_root_resolved = _resolved_root(project_root)
             file_path_resolved = Path(file_path).resolve()
 
-            # Check if the file path is within the project root
-            try:
-                file_path_resolved.relative_to(project_root_resolved)
+            # Check if the file path is within the project root (a string
+            # prefix test on resolved paths, without raising on failure)
+            root_str = str(project_root_resolved)
+            path_str = str(file_path_resolved)
+            if path_str == root_str or path_str.startswith(
+                root_str.rstrip(os.sep) + os.sep
+            ):
                 return True, ""
-            except ValueError:
-                # Path is outside project root
-                return (
-                    False,
-                    SecurityErrorMessages.path_outside_project(
-                        file_path, project_root, tool_name
-                    ),
-                )
+
+            # Path is outside project root
+            return (
+                False,
+                SecurityErrorMessages.path_outside_project(
+                    file_path, project_root, tool_name
+                ),
+            )
 
         except (OSError, RuntimeError) as e:
             return False, f"Error validating path: {e}"
@@ -292,7 +651,16 @@ class SecurityValidator:
         Returns:
             Hook response dict if path is invalid, None if valid
         """
-        import shlex
+        # Check the raw first word before paying for shlex tokenization; only
+        # quoting or escapes can make it differ from shlex's first token
+        parts = command.split(maxsplit=1)
+        if not parts:
+            return None
+        raw_first_word = parts[0]
+        if raw_first_word.lower() not in _PATH_SENSITIVE_COMMANDS and not any(
+            c in raw_first_word for c in "\"'\\"
+        ):
+            return None
 
         try:
             # Parse command into tokens
@@ -304,55 +672,10 @@ class SecurityValidator:
         if not tokens:
             return None
 
-        # Commands that commonly take file paths as arguments
-        path_sensitive_commands = {
-            "cat",
-            "less",
-            "more",
-            "head",
-            "tail",
-            "file",
-            "stat",
-            "cp",
-            "mv",
-            "rm",
-            "mkdir",
-            "rmdir",
-            "touch",
-            "chmod",
-            "chown",
-            "ls",
-            "find",
-            "locate",
-            "grep",
-            "egrep",
-            "fgrep",
-            "vi",
-            "vim",
-            "nano",
-            "emacs",
-            "gedit",
-            "git",
-            "python",
-            "python3",
-            "node",
-            "npm",
-            "pip",
-            "tar",
-            "unzip",
-            "zip",
-            "gzip",
-            "gunzip",
-            "curl",
-            "wget",
-            "scp",
-            "rsync",
-        }
-
         first_word = tokens[0].lower()
 
         # Check if this is a command that might operate on files outside our directory
-        if first_word not in path_sensitive_commands:
+        if first_word not in _PATH_SENSITIVE_COMMANDS:
             return None
 
         # Extract potential file paths from the command
@@ -365,35 +688,13 @@ class SecurityValidator:
                 continue
 
             # Check if token looks like a path
-            if (
-                "/" in token
-                or token.startswith("./")
-                or token.startswith("../")
-                or token.startswith("~/")
-                or token.startswith("/")
-                or
-                # Also check for common file patterns
-                ("." in token and len(token.split(".")) <= 3)
-            ):  # Basic file extension check
+            if _PATH_SHAPE_RE.search(token):
                 potential_paths.append(token)
 
         # Validate each potential path
         for path in potential_paths:
             # Skip URLs and special cases
-            if any(
-                pattern in path
-                for pattern in [
-                    "http://",
-                    "https://",
-                    "ftp://",
-                    "|",
-                    ">",
-                    "<",
-                    "&&",
-                    "||",
-                    "/dev/null",  # Allow /dev/null for redirection
-                ]
-            ):
+            if _NOT_A_PATH_RE.search(path):
                 continue
 
             # For relative paths, resolve them relative to current directory (which should be project root)
@@ -456,8 +757,9 @@ class SecurityValidator:
         if not command or not isinstance(command, str):
             return {}
 
-        # Get first word of command
-        first_word = command.strip().split()[0] if command.strip() else ""
+        # Get first word of command (split off just the first token)
+        parts = command.split(maxsplit=1)
+        first_word = parts[0] if parts else ""
 
         # Validate paths in the command for certain operations
         if project_root:
@@ -504,13 +806,13 @@ class SecurityValidator:
 
         # Check if command is in allowed list
         if first_word in ALLOWED_BASH_COMMANDS:
-            print(f"✅ Allowed: {first_word}")
+            logger.info("✅ Allowed: %s", first_word)
             # Audit log allowed command (exit code will be updated post-execution)
             get_audit_logger().log_bash_command(command, blocked=False)
             return {}
         else:
             error_msg = SecurityErrorMessages.command_not_allowed(
-                command, first_word, list(ALLOWED_BASH_COMMANDS)
+                command, first_word, _ALLOWED_BASH_LIST
             )
             print(f"🚨 BLOCKED: {command}")
             # Audit log blocked command
@@ -557,22 +859,11 @@ class SecurityValidator:
                 input_data, tool_use_id, context, project_root
             )
 
-        # File operation tools to validate
-        file_tools = ["Read", "Edit", "Write", "MultiEdit", "Glob", "Grep"]
-
-        if tool_name not in file_tools:
+        # Only file operation tools are validated; extract the path to check
+        extract_path = _TOOL_PATH_EXTRACTORS.get(tool_name)
+        if extract_path is None:
             return {}
-
-        # Extract file path based on tool type
-        file_path = None
-        if tool_name in ["Read", "Edit", "Write", "MultiEdit"]:
-            file_path = tool_input.get("file_path")
-        elif tool_name == "Glob":
-            # For Glob, validate the base path
-            file_path = tool_input.get("path", ".")
-        elif tool_name == "Grep":
-            # For Grep, validate the search path
-            file_path = tool_input.get("path", ".")
+        file_path = extract_path(tool_input)
 
         if not file_path:
             error_msg = SecurityErrorMessages.no_file_path(tool_name)
@@ -586,11 +877,11 @@ class SecurityValidator:
         if not is_valid:
             print(f"🚨 BLOCKED {tool_name}: {error_reason}")
             # Audit log blocked file operation
-            operation = "read" if tool_name == "Read" else "write"
-            if tool_name == "Edit":
-                operation = "edit"
             get_audit_logger().log_file_operation(
-                operation, file_path, blocked=True, reason=error_reason
+                _TOOL_OPERATIONS.get(tool_name, "write"),
+                file_path,
+                blocked=True,
+                reason=error_reason,
             )
             return {
                 "hookSpecificOutput": {
@@ -601,7 +892,7 @@ class SecurityValidator:
             }
 
         # Additional validation for Edit/Write operations on feature_list.json
-        if tool_name in ["Edit", "Write", "MultiEdit"]:
+        if tool_name in _EDITING_TOOLS:
             test_validation_result = (
                 SecurityValidator._validate_test_result_modification(
                     tool_input, project_root
@@ -618,12 +909,11 @@ class SecurityValidator:
                 return test_validation_result
 
         # Audit log allowed file operation
-        operation = "read" if tool_name == "Read" else "write"
-        if tool_name == "Edit":
-            operation = "edit"
-        get_audit_logger().log_file_operation(operation, file_path, blocked=False)
+        get_audit_logger().log_file_operation(
+            _TOOL_OPERATIONS.get(tool_name, "write"), file_path, blocked=False
+        )
 
-        print(f"✅ Allowed {tool_name}: {file_path}")
+        logger.info("✅ Allowed %s: %s", tool_name, file_path)
         return {}
 
     @staticmethod
@@ -637,7 +927,7 @@ class SecurityValidator:
             Hook response dict
         """
         if command.strip() in ALLOWED_RM_COMMANDS:
-            print(f"✅ Allowed: {command} (cleaning node_modules)")
+            logger.info("✅ Allowed: %s (cleaning node_modules)", command)
             get_audit_logger().log_bash_command(command, blocked=False)
             return {}
         else:
@@ -661,7 +951,7 @@ class SecurityValidator:
             Hook response dict
         """
         if any(pattern in command for pattern in ALLOWED_NODE_PATTERNS):
-            print(f"✅ Allowed: {command}")
+            logger.info("✅ Allowed: %s", command)
             get_audit_logger().log_bash_command(command, blocked=False)
             return {}
         else:
@@ -683,12 +973,12 @@ class SecurityValidator:
             Hook response dict
         """
         if command.strip() in ALLOWED_PKILL_PATTERNS:
-            print(f"✅ Allowed: {command}")
+            logger.info("✅ Allowed: %s", command)
             get_audit_logger().log_bash_command(command, blocked=False)
             return {}
         else:
             error_msg = SecurityErrorMessages.pkill_not_allowed(
-                command, list(ALLOWED_PKILL_PATTERNS)
+                command, _ALLOWED_PKILL_LIST
             )
             print(f"🚨 BLOCKED: {command}")
             get_audit_logger().log_bash_command(
@@ -710,14 +1000,13 @@ class SecurityValidator:
         Returns:
             Hook response dict (empty if allowed, deny response if blocked)
         """
-        for pattern in BLOCKED_SED_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
-                error_msg = SecurityErrorMessages.sed_feature_list_blocked(command)
-                print(f"🚨 BLOCKED: {command}")
-                get_audit_logger().log_bash_command(
-                    command, blocked=True, reason="sed bulk-modify feature_list.json blocked"
-                )
-                return _deny_response(error_msg)
+        if _BLOCKED_SED_RE.search(command):
+            error_msg = SecurityErrorMessages.sed_feature_list_blocked(command)
+            print(f"🚨 BLOCKED: {command}")
+            get_audit_logger().log_bash_command(
+                command, blocked=True, reason="sed bulk-modify feature_list.json blocked"
+            )
+            return _deny_response(error_msg)
         # sed command is allowed (doesn't match blocked patterns)
         return {}
 
@@ -741,29 +1030,34 @@ class SecurityValidator:
         """
 
         tool_name = input_data.get("tool_name", "")
+        if tool_name != "Bash" or not project_root:
+            return {}
 
-        if tool_name == "Bash":
-            tool_input = input_data.get("tool_input", {})
-            command = tool_input.get("command", "")
-
-            # Only check after cd commands
-            if command.strip().startswith("cd ") and project_root:
-                # Get the actual current directory
-                current_dir = os.getcwd()
-
-                # Check if we've escaped the project root
-                if not current_dir.startswith(project_root):
-                    print("⚠️ Directory escape detected!")
-                    print(f"   Current dir: {current_dir}")
-                    print(f"   Project root: {project_root}")
-                    print("   Resetting to project root...")
-
-                    # Reset to project root
-                    os.chdir(project_root)
-
-                    return {
-                        "systemMessage": f"⚠️ You navigated outside the project directory. I've automatically returned you to the project root at `{project_root}`. Please stay within the project directory."
-                    }
+        tool_input = input_data.get("tool_input", {})
+        command = tool_input.get("command", "")
+
+        # Only check after cd commands
+        if not command.lstrip().startswith("cd "):
+            return {}
+
+        # Get the actual current directory (getcwd() is already resolved, so
+        # compare against the resolved root rather than the raw string)
+        current_dir = os.getcwd()
+        root = str(_resolved_root(project_root))
+
+        # Check if we've escaped the project root
+        if os.path.commonpath([current_dir, root]) != root:
+            print("⚠️ Directory escape detected!")
+            print(f"   Current dir: {current_dir}")
+            print(f"   Project root: {project_root}")
+            print("   Resetting to project root...")
+
+            # Reset to project root
+            os.chdir(project_root)
+
+            return {
+                "systemMessage": f"⚠️ You navigated outside the project directory. I've automatically returned you to the project root at `{project_root}`. Please stay within the project directory."
+            }
 
         return {}
 
@@ -780,14 +1074,13 @@ class SecurityValidator:
         Returns:
             Hook response dict (empty if allowed, deny response if blocked)
         """
-        for pattern in BLOCKED_FEATURE_LIST_PATTERNS:
-            if re.search(pattern, command, re.IGNORECASE):
-                error_msg = SecurityErrorMessages.bash_feature_list_blocked(command)
-                print(f"🚨 BLOCKED: {command}")
-                get_audit_logger().log_bash_command(
-                    command, blocked=True, reason="bash modify feature_list.json blocked"
-                )
-                return _deny_response(error_msg)
+        if _BLOCKED_FEATURE_LIST_RE.search(command):
+            error_msg = SecurityErrorMessages.bash_feature_list_blocked(command)
+            print(f"🚨 BLOCKED: {command}")
+            get_audit_logger().log_bash_command(
+                command, blocked=True, reason="bash modify feature_list.json blocked"
+            )
+            return _deny_response(error_msg)
         return {}
 
     @staticmethod
@@ -823,14 +1116,14 @@ class SecurityValidator:
         if not file_path.endswith("feature_list.json"):
             return None
 
-        # Parse the edit to find which test is being marked as passing
-        new_string = tool_input.get("new_string", "")
-        old_string = tool_input.get("old_string", "")
-
         # If changing "passes": false to "passes": true, require screenshot
-        if '"passes": true' not in new_string and "'passes': true" not in new_string:
+        new_string = tool_input.get("new_string", "")
+        if not _PASSES_TRUE_RE.search(new_string):
             return None  # Not marking as passing, allow
 
+        # Parse the edit to find which test is being marked as passing
+        old_string = tool_input.get("old_string", "")
+
         # Extract test ID from context
         test_id = _extract_test_id(old_string, new_string)
 
@@ -850,10 +1143,9 @@ class SecurityValidator:
         # =====================================================================
         # Check 1: Screenshot must exist
         # =====================================================================
-        screenshot_pattern = (
-            f"{project_root}/screenshots/issue-{issue_number}/{test_id}-*.png"
-        )
-        screenshots = glob.glob(screenshot_pattern)
+        screenshot_dir = f"{project_root}/screenshots/issue-{issue_number}"
+        screenshot_pattern = f"{screenshot_dir}/{test_id}-*.png"
+        screenshots = _get_screenshot_index(screenshot_dir).get(test_id, [])
 
         if not screenshots:
             error_msg = SecurityErrorMessages.test_no_screenshot(
@@ -866,7 +1158,9 @@ class SecurityValidator:
         # =====================================================================
         # Check 2: Screenshot must have been viewed
         # =====================================================================
-        screenshot_viewed = any(was_screenshot_viewed(s) for s in screenshots)
+        screenshot_viewed = not _viewed_screenshots.isdisjoint(
+            map(_normalize_screenshot_path, screenshots)
+        )
         if not screenshot_viewed:
             error_msg = SecurityErrorMessages.test_screenshot_not_viewed(
                 test_id, screenshots[0]
@@ -880,30 +1174,28 @@ class SecurityValidator:
         # With Bash-based Playwright CLI, playwright-test.cjs always generates
         # both screenshot and console log files. Console log must exist and
         # contain NO_CONSOLE_ERRORS (not ERRORS:).
-        console_pattern = (
-            f"{project_root}/screenshots/issue-{issue_number}/{test_id}-console.txt"
-        )
-        console_files = glob.glob(console_pattern)
+        # The name has no wildcards, so a single stat replaces a glob's
+        # directory scan
+        console_path = f"{screenshot_dir}/{test_id}-console.txt"
 
-        if not console_files:
+        if not os.path.isfile(console_path):
             # Console log file is REQUIRED
             error_msg = SecurityErrorMessages.test_no_console_log(
-                test_id, issue_number, console_pattern
+                test_id, issue_number, console_path
             )
             print(f"🚨 BLOCKED: No console log file for test '{test_id}'")
             return _deny_response(error_msg)
 
         # Console log exists - verify it was viewed
-        console_viewed = any(was_screenshot_viewed(f) for f in console_files)
-        if not console_viewed:
+        if not was_screenshot_viewed(console_path):
             error_msg = SecurityErrorMessages.test_console_not_viewed(
-                test_id, console_files[0]
+                test_id, console_path
             )
             print(f"🚨 BLOCKED: Console log exists for test '{test_id}' but not viewed")
             return _deny_response(error_msg)
 
         # Check for console errors in the log content
-        console_content = Path(console_files[0]).read_text().strip()
+        console_content = Path(console_path).read_text().strip()
         if console_content.startswith("ERRORS:"):
             error_msg = (
                 f"🚫 TEST BLOCKED: Console errors detected for '{test_id}'\n\n"
@@ -1,11 +1,13 @@
 """Token usage tracking and limit enforcement for Claude Code."""
 
 import json
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from .config import (
+    EVENTS_LOG_FILE_NAME,
     MAX_API_CALLS,
     MAX_COST_USD,
     MAX_OUTPUT_TOKENS,
@@ -117,7 +119,11 @@ class TokenTracker:
             print("📊 No logs directory found - starting with zero token counts")
             return
 
+        # Per-entry *.json files are from runs before events.jsonl existed
         log_files = sorted(logs_dir.glob("*.json"))
+        events_file = logs_dir / EVENTS_LOG_FILE_NAME
+        if events_file.exists():
+            log_files.append(events_file)
         if not log_files:
             print("📊 No log files found - starting with zero token counts")
             return
@@ -126,35 +132,54 @@ class TokenTracker:
 
         for log_file in log_files:
             try:
-                with open(log_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                if data.get("type") == "agent_response":
-                    messages = data.get("messages", [])
-                    for message in messages:
-                        usage = self.extract_usage_from_message(message)
-                        if usage:
-                            self.totals.input_tokens += usage.input_tokens
-                            self.totals.output_tokens += usage.output_tokens
-                            self.totals.cache_creation_input_tokens += (
-                                usage.cache_creation_input_tokens
-                            )
-                            self.totals.cache_read_input_tokens += (
-                                usage.cache_read_input_tokens
-                            )
-                            self.totals.api_calls += 1
-
-                            # Add cost from this API call
-                            if usage.total_cost_usd > 0:
-                                self.totals.total_cost_usd += usage.total_cost_usd
-                            break
-
+                for data in self._read_log_entries(log_file):
+                    if data.get("type") == "agent_response":
+                        self._add_logged_usage(data.get("messages", []))
             except Exception as e:
                 print(f"⚠️ Failed to read log file {log_file}: {e}")
                 continue
         self._print_loaded_totals()
         self._warn_if_approaching_limits()
 
+    @staticmethod
+    def _read_log_entries(log_file: Path) -> Iterator[dict[str, Any]]:
+        """Yield log entries from a JSON file or a JSON Lines file.
+
+        Malformed JSON Lines records (e.g. a torn final write after a crash)
+        are skipped so the rest of the file still counts.
+        """
+        with open(log_file, encoding="utf-8") as f:
+            if log_file.name != EVENTS_LOG_FILE_NAME:
+                yield json.load(f)
+                return
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"⚠️ Skipping malformed line {line_number} in {log_file}: {e}")
+                    continue
+                yield entry
+
+    def _add_logged_usage(self, messages: list[dict[str, Any]]) -> None:
+        """Add the usage of the first message that reports any to the totals."""
+        for message in messages:
+            usage = self.extract_usage_from_message(message)
+            if usage:
+                self.totals.input_tokens += usage.input_tokens
+                self.totals.output_tokens += usage.output_tokens
+                self.totals.cache_creation_input_tokens += (
+                    usage.cache_creation_input_tokens
+                )
+                self.totals.cache_read_input_tokens += usage.cache_read_input_tokens
+                self.totals.api_calls += 1
+
+                # Add cost from this API call
+                if usage.total_cost_usd > 0:
+                    self.totals.total_cost_usd += usage.total_cost_usd
+                break
+
     def _print_loaded_totals(self) -> None:
         """Print loaded token counts."""
         print("📊 Loaded token counts from previous session:")
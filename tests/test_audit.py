@@ -2,6 +2,7 @@
 
 import json
 import tempfile
+import time
 from collections.abc import Generator
 from pathlib import Path
 
@@ -89,6 +90,7 @@ class TestLogBashCommand:
         enabled_logger.log_bash_command("ls -la", exit_code=0, blocked=False)
 
         # Read the log
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -115,6 +117,7 @@ class TestLogBashCommand:
         """Log a command with non-zero exit code."""
         enabled_logger.log_bash_command("exit 1", exit_code=1)
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -133,6 +136,7 @@ class TestLogFileOperation:
         """Log a file read operation."""
         enabled_logger.log_file_operation("read", "/project/src/main.py")
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -145,6 +149,7 @@ class TestLogFileOperation:
         """Log a file write operation."""
         enabled_logger.log_file_operation("write", "/project/config.json")
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -155,6 +160,7 @@ class TestLogFileOperation:
         """Log a file edit operation."""
         enabled_logger.log_file_operation("edit", "/project/src/utils.py")
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -184,6 +190,7 @@ class TestLogSession:
             session_id="abc123", project="canopy", provider="bedrock"
         )
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -197,6 +204,7 @@ class TestLogSession:
         """Log session end."""
         enabled_logger.log_session_end(session_id="abc123", reason="completed")
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -217,6 +225,7 @@ class TestSanitizeInput:
             "success",
         )
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -229,6 +238,7 @@ class TestSanitizeInput:
         long_command = "x" * 2000
         enabled_logger.log_bash_command(long_command)
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -245,6 +255,7 @@ class TestJsonlFormat:
         enabled_logger.log_bash_command("pwd")
         enabled_logger.log_bash_command("echo hello")
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             lines = f.readlines()
 
@@ -259,6 +270,7 @@ class TestJsonlFormat:
         """Timestamps should be in ISO 8601 format."""
         enabled_logger.log_bash_command("ls")
 
+        enabled_logger.flush()
         with open(enabled_logger.log_path) as f:
             log_entry = json.loads(f.readline())
 
@@ -268,6 +280,82 @@ class TestJsonlFormat:
         assert "+" in timestamp or "Z" in timestamp
 
 
+class TestBufferedWrites:
+    """Tests for batched writing of audit events."""
+
+    def test_allowed_events_buffered_until_flush(
+        self, enabled_logger: AuditLogger
+    ) -> None:
+        """Allowed events are held in memory until flushed."""
+        enabled_logger.log_bash_command("ls")
+        assert enabled_logger.log_path.read_text() == ""
+
+        enabled_logger.flush()
+        assert len(enabled_logger.log_path.read_text().splitlines()) == 1
+
+    def test_blocked_event_flushes_buffer(self, enabled_logger: AuditLogger) -> None:
+        """A blocked action is written at once, after earlier events in order."""
+        enabled_logger.log_bash_command("ls")
+        enabled_logger.log_bash_command("sudo ls", blocked=True, reason="not allowed")
+
+        lines = enabled_logger.log_path.read_text().splitlines()
+        assert [json.loads(line)["outcome"] for line in lines] == [
+            "exit_None",
+            "blocked",
+        ]
+
+    def test_flushes_when_buffer_full(self, enabled_logger: AuditLogger) -> None:
+        """A full buffer is written out without an explicit flush."""
+        for i in range(AuditLogger.BUFFER_CAPACITY):
+            enabled_logger.log_bash_command(f"echo {i}")
+
+        lines = enabled_logger.log_path.read_text().splitlines()
+        assert len(lines) == AuditLogger.BUFFER_CAPACITY
+
+    def test_close_flushes_buffer(self, audit_dir: Path) -> None:
+        """Closing the logger writes out buffered events."""
+        logger = AuditLogger(log_dir=audit_dir, enabled=True)
+        logger.log_file_operation("read", "/project/a.py")
+        logger.close()
+
+        assert len(logger.log_path.read_text().splitlines()) == 1
+
+    def test_session_end_flushes_buffer(self, enabled_logger: AuditLogger) -> None:
+        """Ending a session writes out everything logged during it."""
+        enabled_logger.log_bash_command("ls")
+        enabled_logger.log_session_end(reason="completed")
+
+        assert len(enabled_logger.log_path.read_text().splitlines()) == 2
+
+    def test_idle_buffer_flushed_after_interval(
+        self, audit_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Buffered events are written once the flush interval passes."""
+        monkeypatch.setattr(AuditLogger, "FLUSH_INTERVAL_SECONDS", 0.05)
+        logger = AuditLogger(log_dir=audit_dir, enabled=True)
+        try:
+            logger.log_bash_command("ls")
+            deadline = time.monotonic() + 2.0
+            while not logger.log_path.read_text() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert len(logger.log_path.read_text().splitlines()) == 1
+        finally:
+            logger.close()
+
+    def test_reinit_closes_previous_file_handler(self, audit_dir: Path) -> None:
+        """Re-creating the logger closes the file handler it replaces."""
+        first = AuditLogger(log_dir=audit_dir, enabled=True)
+        old_handler = first._file_handler
+        assert old_handler is not None and old_handler.stream is not None
+
+        second = AuditLogger(log_dir=audit_dir, enabled=True)
+        try:
+            assert old_handler.stream is None
+        finally:
+            second.close()
+
+
 class TestGlobalLogger:
     """Tests for global logger management."""
 
@@ -1,5 +1,6 @@
 """Tests for src/github_integration.py - GitHub issue management."""
 
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -42,6 +43,22 @@ class TestBuildableIssue:
         assert result["approved_by"] == ["staff1", "staff2"]
         assert result["created"] == "2025-01-01T12:00:00"
 
+    def test_is_frozen(self) -> None:
+        """BuildableIssue is immutable, so its cached ISO date stays valid."""
+        issue = BuildableIssue(
+            number=1,
+            title="Test Issue",
+            body="",
+            labels=[],
+            thumbs_up_count=0,
+            has_staff_approval=True,
+            approved_by=["staff1"],
+            created_at=datetime(2025, 1, 1, 12, 0, 0),
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            issue.created_at = datetime(2026, 1, 1)  # type: ignore[misc]
+
 
 class TestLabelFiltering:
     """Tests for label filtering in get_buildable_issues."""
@@ -102,8 +119,10 @@ class TestLabelFiltering:
         # Mock reactions for approval
         if has_approval:
             mock_reaction = MagicMock()
-            mock_reaction.content = "rocket"
-            mock_reaction.user.login = "authorized-user"
+            mock_reaction.raw_data = {
+                "content": "rocket",
+                "user": {"login": "authorized-user"},
+            }
             mock_issue.get_reactions.return_value = [mock_reaction]
         else:
             mock_issue.get_reactions.return_value = []
@@ -126,6 +145,32 @@ class TestLabelFiltering:
         assert len(result) == 3
         assert {r.number for r in result} == {1, 2, 3}
 
+    def test_sorted_by_votes_then_age(
+        self, mock_github_manager: GitHubIssueManager
+    ) -> None:
+        """Issues are ordered by votes descending, then oldest first."""
+        issues = [
+            self._create_mock_issue(1, "Issue 1", ["feature"]),
+            self._create_mock_issue(2, "Issue 2", ["feature"]),
+            self._create_mock_issue(3, "Issue 3", ["feature"]),
+            self._create_mock_issue(4, "Issue 4", ["feature"]),
+        ]
+        issues[0].created_at = datetime(2025, 1, 3)
+        issues[1].created_at = datetime(2025, 1, 1)
+        issues[2].created_at = datetime(2025, 1, 2)
+        issues[3].created_at = datetime(2025, 1, 4)
+        votes = {1: 2, 2: 2, 3: 0, 4: 5}
+        mock_github_manager.repo.get_issues.return_value = issues
+
+        with patch.object(
+            mock_github_manager,
+            "_count_thumbs_up",
+            side_effect=lambda issue: votes[issue.number],
+        ):
+            result = mock_github_manager.get_buildable_issues()
+
+        assert [r.number for r in result] == [4, 2, 1, 3]
+
     def test_single_label_filter(self, mock_github_manager: GitHubIssueManager) -> None:
         """Filter by single label only returns matching issues."""
         issues = [
@@ -306,3 +351,72 @@ class TestGetNextBuildableIssue:
             )
 
             assert result is None
+
+
+class TestGenerateFeaturePrompt:
+    """Tests for generate_feature_prompt."""
+
+    @pytest.fixture
+    def mock_github_manager(self) -> GitHubIssueManager:
+        """Create a GitHubIssueManager with mocked GitHub client."""
+        with patch("src.github_integration.Github") as mock_github:
+            mock_repo = MagicMock()
+            mock_github.return_value.get_repo.return_value = mock_repo
+            manager = GitHubIssueManager("test/repo", "fake-token")
+            return manager
+
+    def test_buildable_issue_skips_reaction_fetches(
+        self, mock_github_manager: GitHubIssueManager
+    ) -> None:
+        """Votes and approvers come from the BuildableIssue, not the API."""
+        issue = BuildableIssue(
+            number=42,
+            title="Dark mode",
+            body="Add a dark mode toggle",
+            labels=["feature"],
+            thumbs_up_count=7,
+            has_staff_approval=True,
+            approved_by=["staff1", "staff2"],
+            created_at=datetime(2025, 1, 1, 12, 0, 0),
+        )
+
+        with (
+            patch.object(mock_github_manager, "_count_thumbs_up") as mock_count,
+            patch.object(mock_github_manager, "_get_staff_approvers") as mock_approvers,
+        ):
+            prompt = mock_github_manager.generate_feature_prompt(issue, "/app")
+
+        mock_count.assert_not_called()
+        mock_approvers.assert_not_called()
+        assert "## From GitHub Issue #42" in prompt
+        assert "**Votes:** 7 👍" in prompt
+        assert "**Approved by:** staff1, staff2" in prompt
+        assert "**Requested:** 2025-01-01T12:00:00" in prompt
+        assert "Add a dark mode toggle" in prompt
+        assert "`/app`" in prompt
+        assert "`issue-42` branch" in prompt
+
+    def test_github_issue_fetches_reactions(
+        self, mock_github_manager: GitHubIssueManager
+    ) -> None:
+        """A raw GitHub Issue still has its votes and approvers looked up."""
+        issue = MagicMock()
+        issue.number = 7
+        issue.title = "Search"
+        issue.body = "Add search"
+        issue.created_at = datetime(2025, 2, 1, 9, 30, 0)
+
+        with (
+            patch.object(
+                mock_github_manager, "_count_thumbs_up", return_value=3
+            ) as mock_count,
+            patch.object(
+                mock_github_manager, "_get_staff_approvers", return_value=["staff1"]
+            ) as mock_approvers,
+        ):
+            prompt = mock_github_manager.generate_feature_prompt(issue, "/app")
+
+        mock_count.assert_called_once_with(issue)
+        mock_approvers.assert_called_once_with(issue)
+        assert "**Votes:** 3 👍" in prompt
+        assert "**Approved by:** staff1" in prompt
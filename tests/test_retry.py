@@ -1,19 +1,32 @@
 """Tests for src/retry.py - Retry logic with exponential backoff."""
 
+import asyncio
+import pickle
+import random
+import threading
 import time
+from dataclasses import FrozenInstanceError
 
 import pytest
 
+import src.retry as retry_module
 from src.retry import (
     PERMANENT_STATUS_CODES,
     TRANSIENT_STATUS_CODES,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
     PermanentError,
     RetryableError,
     RetryConfig,
     calculate_delay,
+    get_circuit_breaker,
     get_default_retry_config,
     init_retry_config,
     is_transient_error,
+    iter_delays,
+    pooled_session,
+    reset_default_retry_config,
     set_default_retry_config,
     with_async_retry,
     with_retry,
@@ -47,6 +60,13 @@ class TestRetryConfig:
         assert config.exponential_base == 3.0
         assert config.jitter is False
 
+    def test_is_frozen(self) -> None:
+        """RetryConfig is immutable and hashable."""
+        config = RetryConfig()
+        with pytest.raises(FrozenInstanceError):
+            config.max_retries = 5  # type: ignore[misc]
+        assert hash(config) == hash(RetryConfig())
+
 
 class TestStatusCodes:
     """Tests for HTTP status code classification."""
@@ -85,6 +105,13 @@ class TestCustomExceptions:
         assert error.status_code == 400
         assert error.original_error is original
 
+    def test_pickle_round_trip(self) -> None:
+        """Slotted attributes survive pickling."""
+        error = RetryableError("rate limited", status_code=429)
+        restored = pickle.loads(pickle.dumps(error))
+        assert str(restored) == "rate limited"
+        assert restored.status_code == 429
+
 
 class TestIsTransientError:
     """Tests for is_transient_error function."""
@@ -143,6 +170,20 @@ class TestIsTransientError:
         """OSError (network issues) is transient."""
         assert is_transient_error(OSError()) is True
 
+    def test_subclasses_use_full_checks(self) -> None:
+        """Subclasses of fast-path types are still classified correctly."""
+
+        class ServerError(RetryableError):
+            pass
+
+        class GoneError(PermanentError):
+            pass
+
+        assert is_transient_error(ServerError("boom")) is True
+        assert is_transient_error(GoneError("gone")) is False
+        assert is_transient_error(ConnectionResetError()) is True
+        assert is_transient_error(CircuitOpenError("open")) is False
+
     def test_timeout_in_message_is_transient(self) -> None:
         """Error message containing 'timeout' is transient."""
         assert is_transient_error(Exception("connection timeout")) is True
@@ -193,8 +234,27 @@ class TestCalculateDelay:
 
         for _ in range(100):
             delay = calculate_delay(0, config)
-            # With 0.5 + random(), range is [1.0, 4.0) (0.5*2 to 1.5*2)
-            assert 1.0 <= delay < 4.0
+            # Full jitter draws from [0, capped delay]
+            assert 0.0 <= delay <= 2.0
+
+    def test_iter_delays(self) -> None:
+        """iter_delays yields one delay per allowed retry."""
+        config = RetryConfig(max_retries=3, base_delay=1.0, jitter=False)
+        assert list(iter_delays(config)) == [1.0, 2.0, 4.0]
+        assert list(iter_delays(RetryConfig(max_retries=0))) == []
+
+    def test_injected_rng(self) -> None:
+        """Jitter draws from the supplied generator."""
+        config = RetryConfig(base_delay=2.0, jitter=True)
+        first = calculate_delay(0, config, random.Random(42))
+        assert first == calculate_delay(0, config, random.Random(42))
+
+    def test_jitter_respects_max_delay(self) -> None:
+        """Jittered delay never exceeds max_delay."""
+        config = RetryConfig(base_delay=1.0, max_delay=5.0, jitter=True)
+
+        for _ in range(100):
+            assert 0.0 <= calculate_delay(10, config) <= 5.0
 
 
 class TestWithRetry:
@@ -258,6 +318,51 @@ class TestWithRetry:
             always_fail()
         assert call_count == 3  # Initial + 2 retries
 
+    def test_total_deadline_bounds_retries(self) -> None:
+        """Retries stop once total_deadline has elapsed."""
+        call_count = 0
+        config = RetryConfig(
+            max_retries=10, base_delay=0.05, jitter=False, total_deadline=0.12
+        )
+
+        @with_retry(config)
+        def always_fail() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise RetryableError("transient")
+
+        start = time.monotonic()
+        with pytest.raises(RetryableError):
+            always_fail()
+        elapsed = time.monotonic() - start
+
+        # Gives up within the 0.12s budget instead of running all 10 retries
+        assert call_count == 2
+        assert elapsed < 0.12
+
+    def test_no_sleep_when_backoff_reaches_deadline(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A backoff that would reach the deadline raises without sleeping."""
+        sleeps: list[float] = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        call_count = 0
+        config = RetryConfig(
+            max_retries=10, base_delay=0.05, jitter=False, total_deadline=0.04
+        )
+
+        @with_retry(config)
+        def always_fail() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise RetryableError("transient")
+
+        with pytest.raises(RetryableError):
+            always_fail()
+
+        assert call_count == 1
+        assert sleeps == []
+
     def test_preserves_function_metadata(self) -> None:
         """Decorator preserves function name and docstring."""
 
@@ -288,6 +393,84 @@ class TestWithRetry:
         assert first_delay >= 0.09  # Allow small timing variance
 
 
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker and its use in with_retry."""
+
+    def test_trips_at_failure_rate(self) -> None:
+        """Breaker opens once min_calls is reached at the failure threshold."""
+        breaker = CircuitBreaker(failure_threshold=0.5, min_calls=4)
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_open_circuit_fails_fast(self) -> None:
+        """Calls are not attempted while the circuit is open."""
+        call_count = 0
+        breaker = CircuitBreaker(min_calls=2, reset_timeout=60.0)
+
+        @with_retry(RetryConfig(max_retries=5, base_delay=0.01), breaker)
+        def always_fail() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise RetryableError("transient")
+
+        with pytest.raises(CircuitOpenError):
+            always_fail()
+        assert call_count == 2
+
+        with pytest.raises(CircuitOpenError):
+            always_fail()
+        assert call_count == 2
+
+    def test_half_open_probe_closes(self) -> None:
+        """After reset_timeout a successful probe closes the circuit."""
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0.01)
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+        time.sleep(0.02)
+        assert breaker.allow()
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert not breaker.allow()  # Only one probe at a time
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_half_open_probe_failure_reopens(self) -> None:
+        """A failed probe re-opens the circuit."""
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+    def test_interrupted_probe_releases_breaker(self) -> None:
+        """A probe interrupted by KeyboardInterrupt lets the next call probe."""
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0.0)
+        breaker.record_failure()
+
+        @with_retry(RetryConfig(max_retries=0), breaker)
+        def interrupted() -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            interrupted()
+        assert breaker.allow()
+
+    def test_get_circuit_breaker_shared(self) -> None:
+        """Same key returns the same breaker instance."""
+        assert get_circuit_breaker("api.example.com") is get_circuit_breaker(
+            "api.example.com"
+        )
+        assert get_circuit_breaker("a") is not get_circuit_breaker("b")
+
+
 class TestWithAsyncRetry:
     """Tests for with_async_retry decorator."""
 
@@ -353,6 +536,163 @@ class TestWithAsyncRetry:
             await always_fail()
         assert call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_no_sleep_when_backoff_reaches_deadline(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A backoff that would reach the deadline raises without sleeping."""
+        sleeps: list[float] = []
+
+        async def record_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+        call_count = 0
+        config = RetryConfig(
+            max_retries=10, base_delay=0.05, jitter=False, total_deadline=0.04
+        )
+
+        @with_async_retry(config)
+        async def always_fail() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise RetryableError("transient")
+
+        with pytest.raises(RetryableError):
+            await always_fail()
+
+        assert call_count == 1
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_cancellation_not_retried(self) -> None:
+        """Cancelling the caller stops retries immediately."""
+        call_count = 0
+
+        @with_async_retry(RetryConfig(max_retries=10, base_delay=0.05))
+        async def slow_fail() -> str:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.02)
+            raise RetryableError("transient")
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(slow_fail(), timeout=0.1)
+        assert time.monotonic() - start < 0.3
+        assert call_count < 11
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_breaker(self) -> None:
+        """A cancelled half-open probe lets the next call probe again."""
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0.0)
+        breaker.record_failure()
+
+        @with_async_retry(RetryConfig(max_retries=0), breaker)
+        async def hang() -> None:
+            await asyncio.sleep(10)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(hang(), timeout=0.01)
+        assert breaker.allow()
+
+    @pytest.mark.asyncio
+    async def test_coalesce_identical_calls(self) -> None:
+        """Concurrent identical calls share one underlying call."""
+        call_count = 0
+
+        @with_async_retry(RetryConfig(max_retries=0), coalesce=True)
+        async def fetch(key: str) -> str:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return key.upper()
+
+        results = await asyncio.gather(fetch("a"), fetch("a"), fetch("b"))
+        assert results == ["A", "A", "B"]
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesce_shares_errors(self) -> None:
+        """Waiters see the in-flight call's exception."""
+
+        @with_async_retry(RetryConfig(max_retries=0), coalesce=True)
+        async def fail() -> None:
+            await asyncio.sleep(0.01)
+            raise PermanentError("nope")
+
+        results = await asyncio.gather(fail(), fail(), return_exceptions=True)
+        assert all(isinstance(r, PermanentError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_coalesce_leader_cancelled_waiter_still_served(self) -> None:
+        """Cancelling the call others wait on doesn't cancel the waiters."""
+        call_count = 0
+
+        @with_async_retry(RetryConfig(max_retries=0), coalesce=True)
+        async def fetch(key: str) -> str:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.05)
+            return key.upper()
+
+        leader = asyncio.create_task(fetch("a"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(fetch("a"))
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        assert await follower == "A"
+        assert leader.cancelled()
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesce_cancelled_waiter_raises(self) -> None:
+        """A waiter that is itself cancelled still sees CancelledError."""
+
+        @with_async_retry(RetryConfig(max_retries=0), coalesce=True)
+        async def fetch() -> str:
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.create_task(fetch())
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(fetch())
+        await asyncio.sleep(0.01)
+
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        assert await leader == "done"
+
+    @pytest.mark.asyncio
+    async def test_no_coalesce_by_default(self) -> None:
+        """Without coalesce every call runs."""
+        call_count = 0
+
+        @with_async_retry(RetryConfig(max_retries=0))
+        async def fetch() -> None:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(fetch(), fetch())
+        assert call_count == 2
+
+
+class TestPooledSession:
+    """Tests for pooled_session."""
+
+    def test_shared_per_pool_size(self) -> None:
+        """Same pool size returns the same session."""
+        assert pooled_session() is pooled_session()
+        assert pooled_session(4) is not pooled_session(8)
+
+    def test_adapter_pool_size(self) -> None:
+        """HTTPS adapter uses the requested pool size."""
+        adapter = pooled_session(7).get_adapter("https://api.github.com")
+        assert adapter._pool_maxsize == 7
+
 
 class TestGlobalConfig:
     """Tests for global retry configuration."""
@@ -364,27 +704,133 @@ class TestGlobalConfig:
 
     def test_set_default_config(self) -> None:
         """set_default_retry_config updates global config."""
-        original = get_default_retry_config()
         new_config = RetryConfig(max_retries=10)
 
+        token = set_default_retry_config(new_config)
         try:
-            set_default_retry_config(new_config)
             assert get_default_retry_config() is new_config
         finally:
-            set_default_retry_config(original)
+            reset_default_retry_config(token)
 
-    def test_init_retry_config(self) -> None:
-        """init_retry_config creates and sets config."""
+    def test_reset_default_config(self) -> None:
+        """reset_default_retry_config restores the previous default."""
         original = get_default_retry_config()
+        token = set_default_retry_config(RetryConfig(max_retries=7))
+        reset_default_retry_config(token)
+        assert get_default_retry_config() is original
+
+    @pytest.mark.asyncio
+    async def test_default_config_is_task_local(self) -> None:
+        """A default set inside a task doesn't leak to other tasks."""
+        original = get_default_retry_config()
+
+        async def install() -> None:
+            set_default_retry_config(RetryConfig(max_retries=9))
 
+        await asyncio.create_task(install())
+        assert get_default_retry_config() is original
+
+    def test_decorator_uses_default_config(self) -> None:
+        """Decorators without a config use the module default."""
+        call_count = 0
+
+        token = set_default_retry_config(RetryConfig(max_retries=1, base_delay=0.01))
+        try:
+
+            @with_retry()
+            def always_fail() -> None:
+                nonlocal call_count
+                call_count += 1
+                raise RetryableError("transient")
+
+            with pytest.raises(RetryableError):
+                always_fail()
+            assert call_count == 2
+        finally:
+            reset_default_retry_config(token)
+
+    def test_override_applies_to_already_decorated(self) -> None:
+        """A default set after decoration is used by the next call."""
+        call_count = 0
+
+        @with_retry()
+        def always_fail() -> None:
+            nonlocal call_count
+            call_count += 1
+            raise RetryableError("transient")
+
+        token = set_default_retry_config(RetryConfig(max_retries=2, base_delay=0.01))
+        try:
+            with pytest.raises(RetryableError):
+                always_fail()
+        finally:
+            reset_default_retry_config(token)
+        assert call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_override_applies_to_already_decorated_async(self) -> None:
+        """A default set after decoration is used by the next async call."""
+        call_count = 0
+
+        @with_async_retry()
+        async def always_fail() -> None:
+            nonlocal call_count
+            call_count += 1
+            raise RetryableError("transient")
+
+        token = set_default_retry_config(RetryConfig(max_retries=1, base_delay=0.01))
+        try:
+            with pytest.raises(RetryableError):
+                await always_fail()
+        finally:
+            reset_default_retry_config(token)
+        assert call_count == 2
+
+    def test_init_retry_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """init_retry_config creates and sets config."""
+        monkeypatch.setattr(
+            retry_module, "_process_default_config", get_default_retry_config()
+        )
+
+        config = init_retry_config(max_retries=5, base_delay=2.0, max_delay=120.0)
+        assert config.max_retries == 5
+        assert config.base_delay == 2.0
+        assert config.max_delay == 120.0
+        assert get_default_retry_config() is config
+
+    def test_init_retry_config_visible_to_other_threads(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The process-wide default is seen by threads started elsewhere."""
+        monkeypatch.setattr(
+            retry_module, "_process_default_config", get_default_retry_config()
+        )
+        config = init_retry_config(max_retries=4)
+        seen: list[RetryConfig] = []
+
+        thread = threading.Thread(
+            target=lambda: seen.append(get_default_retry_config())
+        )
+        thread.start()
+        thread.join()
+
+        assert seen == [config]
+
+    def test_context_override_wins_over_process_default(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A context override shadows init_retry_config until it is reset."""
+        monkeypatch.setattr(
+            retry_module, "_process_default_config", get_default_retry_config()
+        )
+        override = RetryConfig(max_retries=8)
+        token = set_default_retry_config(override)
         try:
-            config = init_retry_config(max_retries=5, base_delay=2.0, max_delay=120.0)
-            assert config.max_retries == 5
-            assert config.base_delay == 2.0
-            assert config.max_delay == 120.0
-            assert get_default_retry_config() is config
+            config = init_retry_config(max_retries=2)
+            assert get_default_retry_config() is override
         finally:
-            set_default_retry_config(original)
+            reset_default_retry_config(token)
+        assert get_default_retry_config() is config
 
 
 class TestRetrySettingsConfig:
@@ -0,0 +1,86 @@
+"""Tests for src/secrets.py - Secrets Manager lookups and caching."""
+
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.secrets as secrets
+from src.secrets import clear_secret_cache, get_github_token, prefetch_secrets
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Generator[MagicMock, None, None]:
+    """Replace the Secrets Manager client with a mock and start uncached."""
+    mock_client = MagicMock()
+    monkeypatch.setattr(
+        secrets, "_secrets_manager_client", MagicMock(return_value=mock_client)
+    )
+    clear_secret_cache()
+    yield mock_client
+    clear_secret_cache()
+
+
+def _batch_response(values: dict[str, str]) -> dict[str, Any]:
+    """Build a BatchGetSecretValue response for the given secrets."""
+    return {
+        "SecretValues": [
+            {"Name": name, "SecretString": value} for name, value in values.items()
+        ]
+    }
+
+
+class TestPrefetchSecrets:
+    """Tests for prefetch_secrets."""
+
+    def test_fetches_and_caches(self, client: MagicMock) -> None:
+        """Fetched secrets are returned and served from the cache afterwards."""
+        client.batch_get_secret_value.return_value = _batch_response({"a": "1"})
+
+        assert prefetch_secrets(["a"]) == {"a": "1"}
+        assert secrets.get_secret("a") == "1"
+        client.get_secret_value.assert_not_called()
+
+    def test_only_fetches_uncached(self, client: MagicMock) -> None:
+        """Secrets still in the cache are not requested again."""
+        client.batch_get_secret_value.return_value = _batch_response({"a": "1"})
+        prefetch_secrets(["a"])
+        client.batch_get_secret_value.return_value = _batch_response({"b": "2"})
+
+        assert prefetch_secrets(["a", "b"]) == {"a": "1", "b": "2"}
+        client.batch_get_secret_value.assert_called_with(SecretIdList=["b"])
+
+    def test_batch_failure_returns_empty(self, client: MagicMock) -> None:
+        """A failed batch call returns nothing so callers fall back."""
+        client.batch_get_secret_value.side_effect = RuntimeError("denied")
+
+        assert prefetch_secrets(["a"]) == {}
+
+
+class TestGetGithubToken:
+    """Tests for get_github_token."""
+
+    def test_second_call_uses_cache(self, client: MagicMock) -> None:
+        """A repeated lookup makes no Secrets Manager call."""
+        client.batch_get_secret_value.return_value = _batch_response(
+            {
+                "claude-code/test/github-token-acme": "org-token",
+                "claude-code/test/github-token": "default-token",
+            }
+        )
+        assert get_github_token("acme/repo", environment="test") == "org-token"
+        client.reset_mock()
+
+        assert get_github_token("acme/repo", environment="test") == "org-token"
+        client.batch_get_secret_value.assert_not_called()
+        client.get_secret_value.assert_not_called()
+
+    def test_falls_back_to_default_token(self, client: MagicMock) -> None:
+        """Without an org-specific secret the default token is used."""
+        client.batch_get_secret_value.return_value = _batch_response(
+            {"claude-code/test/github-token": "default-token"}
+        )
+
+        assert get_github_token("acme/repo", environment="test") == "default-token"
+        client.get_secret_value.assert_not_called()
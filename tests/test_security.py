@@ -1,15 +1,25 @@
 """Tests for src/security.py - Security validation hooks and utilities."""
 
+import json
+import os
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
 
+import src.security as security
 from src.config import ALLOWED_BASH_COMMANDS
 from src.security import (
     SecurityValidator,
     _deny_response,
     _extract_test_id,
+    _filter_stale_screenshots,
+    _get_screenshot_index,
+    _load_verification_state,
     clear_screenshot_tracking,
+    flush_verification_state,
     track_screenshot_read,
     was_screenshot_viewed,
 )
@@ -34,6 +44,11 @@ class TestScreenshotTracking:
         track_screenshot_read(path)
         assert was_screenshot_viewed(path)
 
+    def test_equivalent_paths_match(self) -> None:
+        """A screenshot read via a non-normalized path counts as viewed."""
+        track_screenshot_read("/project/screenshots/./issue-1/../issue-1/t.png")
+        assert was_screenshot_viewed("/project/screenshots/issue-1/t.png")
+
     def test_ignore_non_screenshot_file(self) -> None:
         """Don't track non-screenshot files."""
         path = "/project/src/main.py"
@@ -56,6 +71,157 @@ class TestScreenshotTracking:
         assert not was_screenshot_viewed(path)
 
 
+class TestVerificationStatePersistence:
+    """Tests for batched persistence of screenshot tracking state."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_state(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Start each test with no state file and nothing pending."""
+        monkeypatch.setenv("ISSUE_NUMBER", "7")
+        monkeypatch.setattr(security, "_verification_state_file", None)
+        monkeypatch.setattr(security, "_state_dir_ready", False)
+        clear_screenshot_tracking()
+
+    def test_writes_are_batched_until_flush(self, project_root: Path) -> None:
+        """Tracking a few screenshots defers the write until flushed."""
+        state_path = (
+            project_root / "screenshots" / "issue-7" / ".verification-state.json"
+        )
+        paths = [f"{project_root}/screenshots/issue-7/t{i}.png" for i in range(3)]
+        for path in paths:
+            track_screenshot_read(path, str(project_root))
+        assert not state_path.exists()
+
+        flush_verification_state()
+        state = json.loads(state_path.read_text())
+        assert set(state["viewed_screenshots"]) == set(paths)
+
+    def test_tracking_never_writes_synchronously(self, project_root: Path) -> None:
+        """However many screenshots are tracked, writing waits for a flush."""
+        state_path = (
+            project_root / "screenshots" / "issue-7" / ".verification-state.json"
+        )
+        for i in range(50):
+            track_screenshot_read(
+                f"{project_root}/screenshots/issue-7/t{i}.png", str(project_root)
+            )
+        assert not state_path.exists()
+
+        flush_verification_state()
+        assert len(json.loads(state_path.read_text())["viewed_screenshots"]) == 50
+
+    def test_flush_replaces_state_file_atomically(self, project_root: Path) -> None:
+        """Flushing overwrites the state file and leaves no temp file behind."""
+        state_dir = project_root / "screenshots" / "issue-7"
+        state_dir.mkdir(parents=True)
+        (state_dir / ".verification-state.json").write_text("stale")
+
+        track_screenshot_read(f"{state_dir}/t1.png", str(project_root))
+        flush_verification_state()
+
+        assert [p.name for p in state_dir.iterdir()] == [".verification-state.json"]
+        state = json.loads((state_dir / ".verification-state.json").read_text())
+        assert list(state["viewed_screenshots"]) == [f"{state_dir}/t1.png"]
+
+    def test_failed_save_keeps_state_dirty(
+        self, project_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """State that could not be written is written by the next flush."""
+        state_path = (
+            project_root / "screenshots" / "issue-7" / ".verification-state.json"
+        )
+        track_screenshot_read(f"{state_path.parent}/t1.png", str(project_root))
+
+        def fail_replace(src: str, dst: str) -> None:
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patched:
+            patched.setattr(security.os, "replace", fail_replace)
+            flush_verification_state()
+        assert not state_path.exists()
+
+        flush_verification_state()
+        assert len(json.loads(state_path.read_text())["viewed_screenshots"]) == 1
+
+    def test_periodic_flush_writes_dirty_state(
+        self, project_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The background flusher saves tracked screenshots without a shutdown."""
+        monkeypatch.setattr(security, "_FLUSH_INTERVAL_SECONDS", 0.01)
+        monkeypatch.setattr(security, "_flush_registered", False)
+        state_path = (
+            project_root / "screenshots" / "issue-7" / ".verification-state.json"
+        )
+        track_screenshot_read(f"{state_path.parent}/t1.png", str(project_root))
+
+        deadline = time.monotonic() + 2.0
+        while not state_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(json.loads(state_path.read_text())["viewed_screenshots"]) == 1
+
+    def test_load_missing_or_corrupt_state(self, project_root: Path) -> None:
+        """Missing and unparseable state files load as empty state."""
+        state_path = project_root / ".verification-state.json"
+        assert _load_verification_state(state_path) == {"viewed_screenshots": {}}
+
+        state_path.write_text("{not json")
+        assert _load_verification_state(state_path) == {"viewed_screenshots": {}}
+
+
+class TestFilterStaleScreenshots:
+    """Tests for dropping stale entries from persisted state."""
+
+    def test_epoch_timestamps(self) -> None:
+        """Recent epoch timestamps are kept, old ones dropped."""
+        now = int(time.time())
+        viewed = {"fresh.png": now - 60, "stale.png": now - 25 * 3600}
+        assert _filter_stale_screenshots(viewed) == {"fresh.png"}
+
+    def test_legacy_iso_timestamps(self) -> None:
+        """ISO timestamps from older state files are still understood."""
+        now = datetime.now(UTC)
+        viewed = {
+            "fresh.png": now.isoformat(),
+            "stale.png": (now - timedelta(hours=25)).isoformat(),
+            "zulu.png": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "bad.png": "not a timestamp",
+        }
+        assert _filter_stale_screenshots(viewed) == {"fresh.png", "zulu.png"}
+
+
+class TestScreenshotIndex:
+    """Tests for the cached screenshot directory index."""
+
+    def test_groups_by_dashed_test_id(self, project_root: Path) -> None:
+        """Screenshots are found for test IDs that contain dashes."""
+        shot_dir = project_root / "screenshots" / "issue-1"
+        shot_dir.mkdir()
+        for name in ["nav-menu-1.png", "nav-2.png", "nav-menu-console.txt"]:
+            (shot_dir / name).touch()
+
+        index = _get_screenshot_index(str(shot_dir))
+        assert index["nav-menu"] == [f"{shot_dir}/nav-menu-1.png"]
+        assert sorted(index["nav"]) == sorted(
+            [f"{shot_dir}/nav-menu-1.png", f"{shot_dir}/nav-2.png"]
+        )
+
+    def test_rescans_when_directory_changes(self, project_root: Path) -> None:
+        """A new screenshot shows up once the directory mtime changes."""
+        shot_dir = project_root / "screenshots" / "issue-1"
+        shot_dir.mkdir()
+        os.utime(shot_dir, ns=(0, 0))
+        assert _get_screenshot_index(str(shot_dir)) == {}
+
+        (shot_dir / "login-1.png").touch()
+        assert _get_screenshot_index(str(shot_dir)) == {
+            "login": [f"{shot_dir}/login-1.png"]
+        }
+
+    def test_missing_directory(self, project_root: Path) -> None:
+        """A missing directory has no screenshots."""
+        assert _get_screenshot_index(str(project_root / "screenshots" / "nope")) == {}
+
+
 class TestExtractTestId:
     """Tests for _extract_test_id function."""
 
@@ -77,6 +243,16 @@ class TestExtractTestId:
         result = _extract_test_id(old_string, "")
         assert result == "explicit-id"
 
+    def test_id_in_new_string(self) -> None:
+        """Find the ID in new_string when old_string has none."""
+        result = _extract_test_id('"passes": false', '"id": "login", "passes": true')
+        assert result == "login"
+
+    def test_old_string_id_takes_precedence(self) -> None:
+        """An ID in old_string wins over one in new_string."""
+        result = _extract_test_id('"id": "old-id"', '"id": "new-id"')
+        assert result == "old-id"
+
     def test_no_id_found(self) -> None:
         """Return None when no ID can be extracted."""
         old_string = '{"other": "value"}'
@@ -126,6 +302,21 @@ class TestPathValidation:
         )
         assert not is_valid
 
+    def test_sibling_with_shared_prefix_rejected(self, project_root: Path) -> None:
+        """Reject a sibling directory whose name extends the project root's."""
+        file_path = f"{project_root}-other/file.txt"
+        is_valid, _error = SecurityValidator._validate_path_within_run_directory(
+            file_path, str(project_root)
+        )
+        assert not is_valid
+
+    def test_project_root_itself_allowed(self, project_root: Path) -> None:
+        """Accept the project root directory itself."""
+        is_valid, _error = SecurityValidator._validate_path_within_run_directory(
+            str(project_root), str(project_root)
+        )
+        assert is_valid
+
     def test_no_project_root_fails(self) -> None:
         """Reject when no project root is set."""
         is_valid, error = SecurityValidator._validate_path_within_run_directory(
@@ -135,6 +326,37 @@ class TestPathValidation:
         assert "No project root" in error
 
 
+class TestConsoleLogging:
+    """Tests for showing the hooks' INFO messages on the console."""
+
+    @pytest.fixture(autouse=True)
+    def console_logging(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        """Install the real handler, removing it again afterwards."""
+        monkeypatch.setattr(security, "_console_handler", None)
+        level = security.logger.level
+        security.configure_console_logging()
+        yield
+        security.logger.removeHandler(security._console_handler)
+        security.logger.setLevel(level)
+
+    @pytest.mark.asyncio
+    async def test_allowed_command_printed(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Allowed commands are reported on stdout."""
+        input_data = {"tool_name": "Bash", "tool_input": {"command": "ls -la"}}
+        await SecurityValidator.bash_security_hook(input_data)
+
+        assert "✅ Allowed: ls" in capsys.readouterr().out
+
+    def test_configure_is_idempotent(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Calling configure again doesn't print messages twice."""
+        security.configure_console_logging()
+        security.logger.info("📸 Tracked %s view: %s", "screenshot", "a.png")
+
+        assert capsys.readouterr().out.count("📸 Tracked") == 1
+
+
 class TestBashSecurityHook:
     """Tests for bash_security_hook."""
 
@@ -222,6 +444,100 @@ class TestBashSecurityHook:
         result = await SecurityValidator.bash_security_hook(input_data)
         assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "jq '.[0].passes = true' feature_list.json",
+            "echo '[]' > feature_list.json",
+            "sed -i 's/passes/x/' FEATURE_LIST.JSON",
+        ],
+    )
+    async def test_feature_list_modification_blocked(self, command: str) -> None:
+        """Block any blocked pattern, case-insensitively."""
+        input_data = {"tool_name": "Bash", "tool_input": {"command": command}}
+        result = await SecurityValidator.bash_security_hook(input_data)
+        assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    @pytest.mark.asyncio
+    async def test_sed_on_other_file_allowed(self) -> None:
+        """Allow sed edits that don't touch feature_list.json."""
+        input_data = {
+            "tool_name": "Bash",
+            "tool_input": {"command": "sed -i 's/false/true/g' config.json"},
+        }
+        result = await SecurityValidator.bash_security_hook(input_data)
+        assert result == {}
+
+
+class TestTestResultModification:
+    """Tests for _validate_test_result_modification."""
+
+    def test_non_passing_edit_allowed(self, project_root: Path) -> None:
+        """Edits that don't mark a test as passing are allowed."""
+        tool_input = {
+            "file_path": str(project_root / "feature_list.json"),
+            "old_string": '"id": "login", "passes": true',
+            "new_string": '"id": "login", "passes": false',
+        }
+        assert (
+            SecurityValidator._validate_test_result_modification(
+                tool_input, str(project_root)
+            )
+            is None
+        )
+
+    @pytest.mark.parametrize(
+        "new_string",
+        ['"id": "login", "passes": true', '{"id":"login","passes":true}'],
+    )
+    def test_marking_passing_requires_screenshot(
+        self, project_root: Path, new_string: str
+    ) -> None:
+        """Marking a test as passing without a screenshot is blocked."""
+        tool_input = {
+            "file_path": str(project_root / "feature_list.json"),
+            "old_string": '"id": "login", "passes": false',
+            "new_string": new_string,
+        }
+        result = SecurityValidator._validate_test_result_modification(
+            tool_input, str(project_root)
+        )
+        assert result is not None
+        assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    def test_console_log_must_be_viewed(
+        self, project_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The edit is allowed only once screenshot and console log were read."""
+        monkeypatch.setenv("ISSUE_NUMBER", "3")
+        clear_screenshot_tracking()
+        shot_dir = project_root / "screenshots" / "issue-3"
+        shot_dir.mkdir()
+        (shot_dir / "login-1.png").touch()
+        (shot_dir / "login-console.txt").write_text("NO_CONSOLE_ERRORS\n")
+        tool_input = {
+            "file_path": str(project_root / "feature_list.json"),
+            "old_string": '"id": "login", "passes": false',
+            "new_string": '"id": "login", "passes": true',
+        }
+
+        track_screenshot_read(str(shot_dir / "login-1.png"))
+        result = SecurityValidator._validate_test_result_modification(
+            tool_input, str(project_root)
+        )
+        assert result is not None
+        assert "login-console.txt" in str(result)
+
+        track_screenshot_read(str(shot_dir / "login-console.txt"))
+        assert (
+            SecurityValidator._validate_test_result_modification(
+                tool_input, str(project_root)
+            )
+            is None
+        )
+        clear_screenshot_tracking()
+
 
 class TestPathSecurityInBash:
     """Tests for path validation within bash commands."""
@@ -254,6 +570,23 @@ class TestPathSecurityInBash:
         )
         assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
 
+    def test_quoted_command_still_path_checked(self, project_root: Path) -> None:
+        """A quoted command name is still recognised as path-sensitive."""
+        result = SecurityValidator._validate_bash_paths(
+            "'cat' /etc/passwd", str(project_root)
+        )
+        assert result is not None
+        assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    def test_non_path_command_skips_validation(self, project_root: Path) -> None:
+        """Commands that don't take paths are not path-checked."""
+        assert (
+            SecurityValidator._validate_bash_paths(
+                "echo /etc/passwd", str(project_root)
+            )
+            is None
+        )
+
 
 class TestUniversalPathSecurityHook:
     """Tests for universal_path_security_hook."""
@@ -286,6 +619,27 @@ class TestUniversalPathSecurityHook:
         )
         assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
 
+    @pytest.mark.asyncio
+    async def test_grep_path_outside_project(self, project_root: Path) -> None:
+        """Block Grep searches rooted outside the project."""
+        input_data = {
+            "tool_name": "Grep",
+            "tool_input": {"pattern": "root", "path": "/etc"},
+        }
+        result = await SecurityValidator.universal_path_security_hook(
+            input_data, project_root=str(project_root)
+        )
+        assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    @pytest.mark.asyncio
+    async def test_unhandled_tool_passthrough(self, project_root: Path) -> None:
+        """Tools that don't touch files pass through."""
+        input_data = {"tool_name": "WebFetch", "tool_input": {"url": "https://x"}}
+        result = await SecurityValidator.universal_path_security_hook(
+            input_data, project_root=str(project_root)
+        )
+        assert result == {}
+
     @pytest.mark.asyncio
     async def test_bash_delegates_to_bash_hook(self, project_root: Path) -> None:
         """Bash commands are handled by bash_security_hook."""
@@ -299,6 +653,48 @@ class TestUniversalPathSecurityHook:
         assert result == {}  # ls is allowed
 
 
+class TestCdEnforcementHook:
+    """Tests for cd_enforcement_hook."""
+
+    @pytest.mark.asyncio
+    async def test_escape_resets_to_project_root(
+        self, project_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Leaving the project root after cd moves back into it."""
+        monkeypatch.chdir(project_root.parent)
+        input_data = {"tool_name": "Bash", "tool_input": {"command": "cd .."}}
+        result = await SecurityValidator.cd_enforcement_hook(
+            input_data, project_root=str(project_root)
+        )
+        assert "systemMessage" in result
+        assert Path.cwd() == project_root.resolve()
+
+    @pytest.mark.asyncio
+    async def test_subdirectory_allowed(
+        self, project_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Staying inside the project root is fine."""
+        monkeypatch.chdir(project_root / "src")
+        input_data = {"tool_name": "Bash", "tool_input": {"command": "cd src"}}
+        result = await SecurityValidator.cd_enforcement_hook(
+            input_data, project_root=str(project_root)
+        )
+        assert result == {}
+        assert Path.cwd() == (project_root / "src").resolve()
+
+    @pytest.mark.asyncio
+    async def test_non_cd_command_ignored(
+        self, project_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Commands other than cd are not checked."""
+        monkeypatch.chdir(project_root.parent)
+        input_data = {"tool_name": "Bash", "tool_input": {"command": "ls .."}}
+        result = await SecurityValidator.cd_enforcement_hook(
+            input_data, project_root=str(project_root)
+        )
+        assert result == {}
+
+
 class TestAllowedCommands:
     """Tests for allowed bash commands configuration."""
 
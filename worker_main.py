@@ -30,6 +30,7 @@ Environment Variables (optional):
     WORKSPACE_DIR: Base workspace directory (default: /app/workspace)
 """
 
+import signal
 import sys
 from pathlib import Path
 
@@ -41,7 +42,9 @@ from claude_agent_sdk import (
     ProcessError,
 )
 
+from src.audit import get_audit_logger
 from src.cloudwatch_metrics import MetricsPublisher
+from src.security import configure_console_logging, flush_verification_state
 from src.worker_config import WorkerConfig, WorkerStatus
 from src.worker_harness import WorkerHarness
 
@@ -96,6 +99,21 @@ Important rules:
 """
 
 
+def _exit_on_sigterm(signum: int, frame: object) -> None:
+    """Turn SIGTERM (ECS stopping the task) into a normal exit.
+
+    Raising SystemExit unwinds the stack, so shutdown flushes and atexit
+    handlers still run instead of the process dying mid-session.
+    """
+    raise SystemExit(128 + signum)
+
+
+def shutdown() -> None:
+    """Persist buffered session state before the worker exits."""
+    flush_verification_state()
+    get_audit_logger().flush()
+
+
 def main() -> int:
     """Main entry point for the harness-based worker.
 
@@ -110,6 +128,9 @@ def main() -> int:
     print("[WORKER] 🔨 Harness-Enforced Architecture")
     print("=" * 60)
 
+    # Show the security hooks' allow/track messages alongside the prints
+    configure_console_logging()
+
     # Initialize metrics publisher for heartbeats
     metrics = MetricsPublisher(enabled=True)
 
@@ -263,4 +284,8 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    try:
+        sys.exit(main())
+    finally:
+        shutdown()